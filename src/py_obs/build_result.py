@@ -1,6 +1,11 @@
+import asyncio
 from dataclasses import dataclass
 from enum import StrEnum, auto
-from typing import ClassVar
+from typing import Any, AsyncIterator, Callable, ClassVar, Final
+import xml.etree.ElementTree as ET
+
+from aiohttp import ClientResponse
+
 from py_obs.osc import Osc
 from py_obs.xml_factory import MetaMixin
 
@@ -20,7 +25,10 @@ class PackageCode(StrEnum):
     FINISHED = auto()
 
 
-@dataclass(frozen=True)
+_PACKAGE_CODE_LOOKUP: dict[str, PackageCode] = {m.value: m for m in PackageCode}
+
+
+@dataclass(frozen=True, slots=True)
 class PackageStatus(MetaMixin):
     _element_name: ClassVar[str] = "status"
 
@@ -29,6 +37,12 @@ class PackageStatus(MetaMixin):
 
     details: list[str]
 
+    _field_converters: ClassVar[dict[str, Callable[[ET.Element], Any]] | None] = {
+        "code": lambda elem: _PACKAGE_CODE_LOOKUP.get(
+            elem.attrib["code"], PackageCode.UNKNOWN
+        )
+    }
+
 
 class RepositoryCode(StrEnum):
     UNKNOWN = auto()
@@ -42,7 +56,10 @@ class RepositoryCode(StrEnum):
     UNPUBLISHED = auto()
 
 
-@dataclass(frozen=True)
+_REPO_CODE_LOOKUP: dict[str, RepositoryCode] = {m.value: m for m in RepositoryCode}
+
+
+@dataclass(frozen=True, slots=True)
 class BuildResult(MetaMixin):
     _element_name: ClassVar[str] = "result"
 
@@ -55,27 +72,75 @@ class BuildResult(MetaMixin):
 
     status: list[PackageStatus]
 
+    _field_converters: ClassVar[dict[str, Callable[[ET.Element], Any]] | None] = {
+        "state": lambda elem: _REPO_CODE_LOOKUP.get(
+            elem.attrib["state"], RepositoryCode.UNKNOWN
+        ),
+        "code": lambda elem: _REPO_CODE_LOOKUP.get(
+            elem.attrib["code"], RepositoryCode.UNKNOWN
+        ),
+    }
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BuildResultList(MetaMixin):
     _element_name: ClassVar[str] = "resultlist"
 
     result: list[BuildResult]
 
+    @classmethod
+    async def iter_from_stream(cls, resp: ClientResponse) -> AsyncIterator[BuildResult]:
+        """Parse the response incrementally and yield each build result as soon
+        as it has been received, without reading the whole response into
+        memory first.
+
+        """
+        async for res in BuildResult.from_response_stream(resp, cls._element_name):
+            yield res
+
+
+#: query parameters that are the same for every build result request
+_BUILD_RESULT_PARAMS: Final[dict[str, str]] = {
+    "view": "status",
+    "multibuild": "1",
+    "locallink": "1",
+}
+
+
+async def iter_build_results(
+    osc: Osc, project_name: str, package_name: str
+) -> AsyncIterator[BuildResult]:
+    """Retrieve the build results of the package in the supplied project and
+    yield them one at a time while the response is still being received.
+
+    """
+    async for res in BuildResultList.iter_from_stream(
+        await osc.api_request(
+            f"/build/{project_name}/_result",
+            params={**_BUILD_RESULT_PARAMS, "package": package_name},
+        )
+    ):
+        yield res
+
 
 async def fetch_build_result(
     osc: Osc, project_name: str, package_name: str
 ) -> list[BuildResult]:
-    return (
-        await BuildResultList.from_response(
-            await osc.api_request(
-                f"/build/{project_name}/_result",
-                params={
-                    "view": "status",
-                    "multibuild": "1",
-                    "locallink": "1",
-                    "package": package_name,
-                },
-            )
-        )
-    ).result
+    return [res async for res in iter_build_results(osc, project_name, package_name)]
+
+
+async def fetch_build_results_many(
+    osc: Osc, project_name: str, package_names: list[str]
+) -> dict[str, list[BuildResult]]:
+    """Fetch the build results of all supplied packages in the project
+    concurrently. Returns a dictionary with the package names as keys and the
+    respective build results as values.
+
+    The number of requests that are actually in flight at the same time is
+    limited by the connection pool of ``osc``.
+
+    """
+    results = await asyncio.gather(
+        *(fetch_build_result(osc, project_name, pkg) for pkg in package_names)
+    )
+    return dict(zip(package_names, results))
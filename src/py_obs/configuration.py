@@ -5,7 +5,7 @@ from py_obs.osc import Osc
 from py_obs.xml_factory import MetaMixin, StrElementField
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Configuration(MetaMixin):
     """Configuration of the OBS instance"""
 
@@ -9,7 +9,10 @@ from py_obs.project import Package, Project
 from py_obs.xml_factory import MetaMixin, StrElementField
 
 
-@dataclass(frozen=True)
+_fromtimestamp = datetime.datetime.fromtimestamp
+
+
+@dataclass(frozen=True, slots=True)
 class Revision(MetaMixin):
     """A revision of a package or its metadata"""
 
@@ -36,8 +39,9 @@ class Revision(MetaMixin):
 
     @staticmethod
     def _datetime_from_xml(xml_element: ET.Element) -> datetime.datetime | None:
-        if (elem := xml_element.find("time")) is not None:
-            return datetime.datetime.fromtimestamp(float(elem.text or "0"))
+        # OBS stores integer unix timestamps
+        if (elem := xml_element.find("time")) is not None and elem.text:
+            return _fromtimestamp(int(elem.text))
         return None
 
     _field_converters: typing.ClassVar[
@@ -45,7 +49,7 @@ class Revision(MetaMixin):
     ] = {"time": _datetime_from_xml}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _RevisionList(MetaMixin):
     """The commit history of a package"""
 
@@ -80,8 +84,8 @@ async def fetch_package_history(
     if limit:
         params["limit"] = str(limit)
 
-    prj_name = project.name if isinstance(project, Project) else project
-    pkg_name = package.name if isinstance(package, Package) else package
+    prj_name = project if isinstance(project, str) else project.name
+    pkg_name = package if isinstance(package, str) else package.name
 
     return (
         await _RevisionList.from_response(
@@ -3,6 +3,7 @@ import logging
 handler = logging.StreamHandler()
 handler.setFormatter(logging.Formatter(fmt="%(levelname)s: %(message)s"))
 
+#: The level is inherited from the root logger (``WARNING`` by default), call
+#: ``LOGGER.setLevel(logging.DEBUG)`` to see the requests that are sent.
 LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.DEBUG)
 LOGGER.addHandler(handler)
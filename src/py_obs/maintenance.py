@@ -1,21 +1,6 @@
-from dataclasses import dataclass
 from py_obs.osc import ObsException, Osc
 from py_obs.project import Package
-from py_obs.xml_factory import MetaMixin
-
-
-@dataclass(frozen=True)
-class _Collection(MetaMixin):
-    _element_name = "collection"
-
-    @dataclass(frozen=True)
-    class _Package(MetaMixin):
-        _element_name = "package"
-
-        package: str
-        project: str
-
-    package: list[_Package]
+from py_obs.xml_factory import parse_response
 
 
 async def fetch_maintained_code_streams(osc: Osc, pkg: Package | str) -> list[str]:
@@ -42,5 +27,7 @@ async def fetch_maintained_code_streams(osc: Osc, pkg: Package | str) -> list[st
             return []
         raise
 
-    res = await _Collection.from_response(resp)
-    return [pkg.project for pkg in res.package]
+    # only the project names are needed => skip decoding the whole collection
+    if (collection := await parse_response(resp)).tag != "collection":
+        raise ValueError(f"Invalid XML tag '{collection.tag}', expected 'collection'")
+    return [pkg.attrib["project"] for pkg in collection.findall("package")]
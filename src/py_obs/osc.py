@@ -1,24 +1,58 @@
 import asyncio
+import atexit
+import base64
 import configparser
 import dataclasses
+import email.utils
+import functools
+import hashlib
 import http.cookiejar
+import logging
 import os
 import os.path
+import random
 import re
+import shutil
+import stat
 import subprocess
+import tempfile
+import threading
 import time
 import typing
-import urllib.request
 
 import aiohttp
 from aiohttp.abc import AbstractCookieJar
 from multidict import CIMultiDictProxy
-from yarl import URL
 
 from py_obs.logger import LOGGER
 
+try:
+    from cryptography.exceptions import UnsupportedAlgorithm  # type: ignore[import-not-found]
+    from cryptography.hazmat.primitives import hashes, serialization  # type: ignore[import-not-found]
+    from cryptography.hazmat.primitives.asymmetric import (  # type: ignore[import-not-found]
+        ec,
+        ed25519,
+        padding,
+        rsa,
+        utils,
+    )
+except ImportError:
+    serialization = None  # type: ignore[assignment]
+
 
 class ObsException(aiohttp.ClientResponseError):
+    @classmethod
+    def from_client_response_error(
+        cls, cre_exc: aiohttp.ClientResponseError
+    ) -> "ObsException":
+        return cls(
+            cre_exc.request_info,
+            cre_exc.history,
+            status=cre_exc.status,
+            message=cre_exc.message,
+            headers=cre_exc.headers,
+        )
+
     def __str__(self) -> str:
         return (
             f"Error talking to OBS: {self.status=}, {self.message=},"
@@ -26,132 +60,489 @@ class ObsException(aiohttp.ClientResponseError):
         )
 
 
+def _ssh_string(data: bytes) -> bytes:
+    return len(data).to_bytes(4, "big") + data
+
+
+def _ssh_mpint(num: int) -> bytes:
+    return _ssh_string(num.to_bytes(num.bit_length() // 8 + 1, "big"))
+
+
+def _load_ssh_private_key(ssh_key_path: str) -> typing.Any:
+    """Load the private key belonging to ``ssh_key_path`` (which may point to
+    the public key) so that signatures can be created without invoking
+    ``ssh-keygen``.
+
+    Returns ``None`` if :py:mod:`cryptography` is not installed or if the key
+    cannot be used without user interaction (e.g. because it is passphrase
+    protected or only available via the ssh-agent).
+
+    """
+    if serialization is None:
+        return None
+
+    path = ssh_key_path[:-4] if ssh_key_path.endswith(".pub") else ssh_key_path
+    try:
+        with open(path, "rb") as key_f:
+            key = serialization.load_ssh_private_key(key_f.read(), password=None)
+    except (OSError, ValueError, TypeError, UnsupportedAlgorithm):
+        return None
+
+    if isinstance(
+        key,
+        (ed25519.Ed25519PrivateKey, rsa.RSAPrivateKey, ec.EllipticCurvePrivateKey),
+    ):
+        return key
+    return None
+
+
+def _sshsig_sign(private_key: typing.Any, namespace: str, data: bytes) -> str:
+    """Sign ``data`` like ``ssh-keygen -Y sign -n $namespace`` and return the
+    base64 encoded signature blob without any newlines (see
+    https://github.com/openssh/openssh-portable/blob/master/PROTOCOL.sshsig).
+
+    """
+    magic = b"SSHSIG"
+    hash_alg = b"sha512"
+    signed_data = (
+        magic
+        + _ssh_string(namespace.encode())
+        + _ssh_string(b"")
+        + _ssh_string(hash_alg)
+        + _ssh_string(hashlib.sha512(data).digest())
+    )
+
+    if isinstance(private_key, ed25519.Ed25519PrivateKey):
+        sig = _ssh_string(b"ssh-ed25519") + _ssh_string(private_key.sign(signed_data))
+    elif isinstance(private_key, rsa.RSAPrivateKey):
+        sig = _ssh_string(b"rsa-sha2-512") + _ssh_string(
+            private_key.sign(signed_data, padding.PKCS1v15(), hashes.SHA512())
+        )
+    else:
+        curve_bits = private_key.curve.key_size
+        digest = {256: hashes.SHA256(), 384: hashes.SHA384(), 521: hashes.SHA512()}[
+            curve_bits
+        ]
+        r, s = utils.decode_dss_signature(
+            private_key.sign(signed_data, ec.ECDSA(digest))
+        )
+        sig = _ssh_string(f"ecdsa-sha2-nistp{curve_bits}".encode()) + _ssh_string(
+            _ssh_mpint(r) + _ssh_mpint(s)
+        )
+
+    public_key = base64.b64decode(
+        private_key.public_key()
+        .public_bytes(
+            serialization.Encoding.OpenSSH, serialization.PublicFormat.OpenSSH
+        )
+        .split()[1]
+    )
+    blob = (
+        magic
+        + (1).to_bytes(4, "big")
+        + _ssh_string(public_key)
+        + _ssh_string(namespace.encode())
+        + _ssh_string(b"")
+        + _ssh_string(hash_alg)
+        + _ssh_string(sig)
+    )
+    return base64.b64encode(blob).decode()
+
+
+#: matches the ``key=value`` and ``key="value"`` pairs of an auth challenge
+_AUTH_PARAM_RE = re.compile(r'(\w+)\s*=\s*(?:"([^"]*)"|([^\s,]*))')
+
+
+def _parse_auth_challenge(challenge: str) -> tuple[str, dict[str, str]]:
+    """Split the value of a ``WWW-Authenticate`` header into the lower cased
+    auth scheme and its parameters.
+
+    """
+    scheme, _, params = challenge.partition(" ")
+    return scheme.lower(), {
+        key: quoted or token for key, quoted, token in _AUTH_PARAM_RE.findall(params)
+    }
+
+
+_SSH_SIG_PREFIX = "-----BEGIN SSH SIGNATURE-----\n"
+_SSH_SIG_SUFFIX = "\n-----END SSH SIGNATURE-----"
+_DELETE_NEWLINES = str.maketrans("", "", "\n")
+
+
+def _extract_ssh_signature(armored: str) -> str:
+    """Extract the base64 encoded signature from the armored output of
+    ``ssh-keygen -Y sign``.
+
+    """
+    if not armored.startswith(_SSH_SIG_PREFIX):
+        raise RuntimeError("Could not extract SSH signature")
+
+    sig, found_suffix, _ = armored[len(_SSH_SIG_PREFIX) :].rpartition(_SSH_SIG_SUFFIX)
+    if not found_suffix or not sig:
+        raise RuntimeError("Could not extract SSH signature")
+
+    # headers must not contain newlines; removing them makes no difference
+    # in base64 encoded text
+    return sig.translate(_DELETE_NEWLINES)
+
+
+@functools.cache
+def _ssh_keygen_executable() -> str:
+    # subprocess only uses the cheaper posix_spawn() instead of fork() + exec()
+    # for executables with a directory component, so resolve it once
+    return shutil.which("ssh-keygen") or "ssh-keygen"
+
+
 class SignatureAuth(aiohttp.BasicAuth):
+    #: number of seconds for which a signature is reused for further requests,
+    #: a shorter time limits how long a leaked header can be replayed, a longer
+    #: one saves signing operations (and ``ssh-keygen`` invocations)
+    SIGNATURE_TTL: typing.ClassVar[int] = 30
+
+    #: creation time and signature per SSH key and realm, shared by all
+    #: instances so that new ones can reuse a still valid signature
+    _signatures: typing.ClassVar[dict[tuple[str, str], tuple[int, str]]] = {}
+
     def __new__(
-        cls, login: str, ssh_key_path: str, response_headers
+        cls,
+        login: str,
+        ssh_key_path: str,
+        realm: str,
+        private_key: typing.Any = None,
     ) -> "SignatureAuth":
-        # TODO: add type hint for response_headers
         self = super().__new__(cls, login)
         self.ssh_key_path = ssh_key_path  # type: ignore[attr-defined]
-        self.response_headers = response_headers  # type: ignore[attr-defined]
-        return self  # type: ignore[return-value]
-
-    def encode(self) -> str:
-        if not os.path.isfile(self.ssh_key_path):  # type: ignore[attr-defined]
-            raise RuntimeError(
-                "The specified SSH key file does not exist: " + self.ssh_key_path  # type: ignore[attr-defined]
-            )
-
-        challenge = self.response_headers.get(  # type: ignore[attr-defined]
-            "WWW-Authenticate"
-        ).split(" ", 1)[1]
-        parsed_challenge = urllib.request.parse_keqv_list(
-            urllib.request.parse_http_list(challenge)
-        )
-        realm = parsed_challenge["realm"]
-        now = int(time.time())
-        data = f"(created): {now}"
-        cmd = [
-            "ssh-keygen",
+        #: realm of the signature challenge, used as the signature's namespace
+        self.realm = realm  # type: ignore[attr-defined]
+        self._ssh_keygen_cmd = (  # type: ignore[attr-defined]
+            _ssh_keygen_executable(),
             "-Y",
             "sign",
             "-f",
-            self.ssh_key_path,  # type: ignore[attr-defined]
+            ssh_key_path,
             "-n",
             realm,
             "-q",
-        ]
-        proc = subprocess.Popen(
-            cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, encoding="utf-8"
         )
-        stdout, stderr = proc.communicate(data)
+        #: private key loaded via :py:func:`_load_ssh_private_key`, if it is
+        #: ``None``, then ``ssh-keygen`` is used for signing
+        self.private_key = private_key  # type: ignore[attr-defined]
+        return self  # type: ignore[return-value]
+
+    def encode(self) -> str:
+        now = int(time.time())
+        if (cached := self._cached_signature(now)) is not None:
+            return self._header(*cached)
+
+        realm, data = self._signed_data(now)
+        if self.private_key is not None:  # type: ignore[attr-defined]
+            sig = _sshsig_sign(
+                self.private_key, realm, data.encode()  # type: ignore[attr-defined]
+            )
+        else:
+            sig = self._sign_with_ssh_keygen(data)
+
+        self._signatures[(self.ssh_key_path, realm)] = (now, sig)  # type: ignore[attr-defined]
+        return self._header(now, sig)
+
+    async def encode_async(self) -> str:
+        """Same as :py:meth:`encode`, but does not block the event loop while
+        ``ssh-keygen`` creates the signature.
+
+        """
+        now = int(time.time())
+        if (cached := self._cached_signature(now)) is not None:
+            return self._header(*cached)
+
+        realm, data = self._signed_data(now)
+        if self.private_key is not None:  # type: ignore[attr-defined]
+            sig = _sshsig_sign(
+                self.private_key, realm, data.encode()  # type: ignore[attr-defined]
+            )
+        else:
+            sig = await self._sign_with_ssh_keygen_async(data)
+
+        self._signatures[(self.ssh_key_path, realm)] = (now, sig)  # type: ignore[attr-defined]
+        return self._header(now, sig)
+
+    def _cached_signature(self, now: int) -> tuple[int, str] | None:
+        cached = self._signatures.get(
+            (self.ssh_key_path, self.realm)  # type: ignore[attr-defined]
+        )
+        if cached is not None and now - cached[0] < self.SIGNATURE_TTL:
+            return cached
+        return None
+
+    def _signed_data(self, now: int) -> tuple[str, str]:
+        """Returns the realm (the namespace of the signature) and the data to
+        sign.
+
+        """
+        return self.realm, f"(created): {now}"  # type: ignore[attr-defined]
+
+    def _header(self, created: int, sig: str) -> str:
+        return (
+            f'Signature keyId="{self.login}",algorithm="ssh",headers="(created)",'
+            f'created={created},signature="{sig}"'
+        )
+
+    def _sign_with_ssh_keygen(self, data: str) -> str:
+        # all file descriptors created by Python are non-inheritable, so there
+        # is no need for the slower close_fds=True
+        proc = subprocess.run(
+            self._ssh_keygen_cmd,  # type: ignore[attr-defined]
+            input=data,
+            stdout=subprocess.PIPE,
+            encoding="utf-8",
+            close_fds=False,
+        )
+        stdout, stderr = proc.stdout, proc.stderr
         if proc.returncode != 0:
             raise RuntimeError(
                 f"ssh-keygen exited with {proc.returncode} and got {stdout=}, {stderr=}"
             )
 
-        match = re.match(
-            r"\A-----BEGIN SSH SIGNATURE-----\n(.*)\n-----END SSH SIGNATURE-----",
-            stdout,
-            re.S,
+        return _extract_ssh_signature(stdout)
+
+    async def _sign_with_ssh_keygen_async(self, data: str) -> str:
+        proc = await asyncio.create_subprocess_exec(
+            *self._ssh_keygen_cmd,  # type: ignore[attr-defined]
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            close_fds=False,
         )
-        if not match:
-            raise RuntimeError("Could not extract SSH signature")
+        stdout_b, stderr_b = await proc.communicate(data.encode())
+        stdout = stdout_b.decode()
+        if proc.returncode != 0:
+            stderr = stderr_b.decode() if stderr_b else None
+            raise RuntimeError(
+                f"ssh-keygen exited with {proc.returncode} and got {stdout=}, {stderr=}"
+            )
 
-        # headers must not contain newlines; removing them makes no difference
-        # in base64 encoded text
-        sig = match.group(1).replace("\n", "")
+        return _extract_ssh_signature(stdout)
+
+
+#: the size in bytes of the ``#LWP-Cookies-2.0`` header plus the shortest
+#: possible cookie line, smaller files cannot contain a cookie
+_MIN_LWP_COOKIE_FILE_SIZE = 32
 
-        auth = (
-            f'Signature keyId="{self.login}",algorithm="ssh",headers="(created)",'
-            f'created={now},signature="{sig}"'
-        )
-        return auth
+
+#: cookie jars with changes that have not been written to disk yet, flushed
+#: on exit. The jars are referenced until they have been saved, so that the
+#: changes of a discarded :py:class:`Osc` instance are not lost, afterwards
+#: they are removed and can be garbage collected.
+_UNSAVED_COOKIE_JARS: "set[CookieJar]" = set()
+
+
+@atexit.register
+def _flush_cookie_jars() -> None:
+    for jar in list(_UNSAVED_COOKIE_JARS):
+        jar.flush()
 
 
 class CookieJar(http.cookiejar.LWPCookieJar):
     """
     A wrapper encapsulating LWPCookieJar for use in aiohttp.
+
+    Updated cookies are not written to disk right away, but at most once per
+    :py:attr:`SAVE_DELAY` seconds in a worker thread, on :py:meth:`flush` or on
+    exit.
     """
 
+    #: seconds by which writing the cookies to disk is deferred
+    SAVE_DELAY: typing.ClassVar[float] = 0.5
+
+    _save_handle: asyncio.TimerHandle | None
+
+    #: result of :py:meth:`filter_cookies` per host together with the
+    #: modification count of the jar at which it was computed
+    _filter_cache: dict[str, tuple[int, list[tuple[str, str]]]]
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        if os.path.isfile(self.filename):
+        #: incremented on every modification of the jar
+        self._version = 0
+        self._filter_cache = {}
+        self._dirty = False
+        self._save_handle = None
+        self._save_in_flight = False
+        self._dir_ready = False
+        # the jar is serialized on the event loop, but written in a worker
+        # thread or by flush(): the lock serializes the writes and the
+        # generations ensure that an older state never overwrites a newer one
+        self._write_lock = threading.Lock()
+        self._generation = 0
+        self._written_generation = 0
+        try:
+            st = os.stat(self.filename)
+        except OSError:
+            return
+
+        # a jar without a single cookie consists only of the LWP header, don't
+        # bother parsing it
+        if stat.S_ISREG(st.st_mode) and st.st_size >= _MIN_LWP_COOKIE_FILE_SIZE:
             try:
                 self.load()
-            except http.cookiejar.LoadError:
+            except (http.cookiejar.LoadError, OSError):
                 pass
 
+    def set_cookie(self, cookie):
+        super().set_cookie(cookie)
+        self._version += 1
+
+    def clear(self, domain=None, path=None, name=None):
+        super().clear(domain, path, name)
+        self._version += 1
+
     def filter_cookies(self, request_url):
-        result = []
-        for cookie in self:
-            if cookie.domain == request_url.host or (
-                cookie.domain.startswith(".")
-                and request_url.host.endswith(cookie.domain)
-            ):
-                result.append((cookie.name, cookie.value))
-        return result
+        if not (host := request_url.host):
+            return []
+
+        # the jar rarely changes between requests
+        if (cached := self._filter_cache.get(host)) and cached[0] == self._version:
+            return cached[1]
+
+        # the cookies are stored per domain, so instead of checking every
+        # cookie, look up the host itself and all of its parent domains with
+        # a leading dot
+        labels = host.split(".")
+        domains = [host] + ["." + ".".join(labels[i:]) for i in range(1, len(labels))]
+        cookies = [
+            (cookie.name, cookie.value)
+            for domain in domains
+            for cookies_by_name in self._cookies.get(domain, {}).values()
+            for cookie in cookies_by_name.values()
+        ]
+        self._filter_cache[host] = (self._version, cookies)
+        return cookies
 
     def update_cookies(self, cookies, response_url):
+        now = int(time.time())
         for name, cookie in cookies.items():
-            if cookie["max-age"]:
-                now = int(time.time())
-                expires = now + int(cookie["max-age"])
+            if max_age := cookie["max-age"]:
+                expires = now + int(max_age)
             elif cookie["expires"]:
-                expires = cookie["expires"]
+                # Cookie() only accepts the expiry as a timestamp
+                expires = http.cookiejar.http2time(cookie["expires"])
             else:
                 expires = None
 
-            c = http.cookiejar.Cookie(
-                version=cookie["version"] or 0,
-                name=name,
-                value=cookie.value,
-                port=None,
-                port_specified=False,
-                domain=cookie["domain"] or None,
-                domain_specified=True,
-                domain_initial_dot=cookie["domain"].startswith("."),
-                path=cookie["path"] or None,
-                path_specified=True,
-                secure=cookie["secure"] or None,
-                expires=expires,
-                discard=False,
-                comment=cookie["comment"] or None,
-                comment_url=None,
-                rest={},
+            # a cookie without a domain only belongs to the host that set it
+            domain = cookie["domain"]
+            self.set_cookie(
+                http.cookiejar.Cookie(
+                    version=cookie["version"] or 0,
+                    name=name,
+                    value=cookie.value,
+                    port=None,
+                    port_specified=False,
+                    domain=domain or response_url.host,
+                    domain_specified=bool(domain),
+                    domain_initial_dot=domain.startswith("."),
+                    path=cookie["path"] or None,
+                    path_specified=True,
+                    secure=cookie["secure"] or None,
+                    expires=expires,
+                    discard=False,
+                    comment=cookie["comment"] or None,
+                    comment_url=None,
+                    rest={},
+                )
             )
-            self.set_cookie(c)
+
+        self._dirty = True
+        self._schedule_save()
+
+    def flush(self) -> None:
+        """Write the cookies to disk if they were updated since the last
+        save.
+
+        """
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+
+        if self._dirty:
+            self._write(*self._snapshot())
+        _UNSAVED_COOKIE_JARS.discard(self)
+
+    def _schedule_save(self) -> None:
+        # a save that is currently in flight reschedules itself once it is
+        # done
+        if self._save_handle is not None or self._save_in_flight:
+            return
 
         try:
-            os.makedirs(os.path.dirname(self.filename), mode=0o700)
-        except FileExistsError:
-            pass
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+
+        _UNSAVED_COOKIE_JARS.add(self)
+        self._save_handle = loop.call_later(
+            self.SAVE_DELAY, self._save_in_background, loop
+        )
+
+    def _save_in_background(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._save_handle = None
+        if not self._dirty:
+            return
+
+        self._save_in_flight = True
+        loop.run_in_executor(None, self._write, *self._snapshot()).add_done_callback(
+            self._background_save_done
+        )
+
+    def _background_save_done(self, fut: asyncio.Future[None]) -> None:
+        self._save_in_flight = False
+        if not fut.cancelled() and (exc := fut.exception()) is not None:
+            LOGGER.warning("Could not save the cookies to %s: %s", self.filename, exc)
+        if self._dirty:
+            self._schedule_save()
+        else:
+            _UNSAVED_COOKIE_JARS.discard(self)
+
+    def _snapshot(self) -> tuple[str, int]:
+        self._dirty = False
+        self._generation += 1
+        return (
+            "#LWP-Cookies-2.0\n"
+            + self.as_lwp_str(ignore_discard=False, ignore_expires=False),
+            self._generation,
+        )
 
-        self.save()
+    def _write(self, contents: str, generation: int) -> None:
+        assert self.filename
+        dirname = os.path.dirname(self.filename) or os.curdir
+        with self._write_lock:
+            if generation <= self._written_generation:
+                return
+
+            if not self._dir_ready:
+                try:
+                    os.makedirs(dirname, mode=0o700)
+                except FileExistsError:
+                    pass
+                self._dir_ready = True
+
+            # replace the jar atomically, so that it is never observed
+            # partially written
+            fd, tmp_path = tempfile.mkstemp(dir=dirname, prefix=".cookiejar")
+            try:
+                with os.fdopen(fd, "w") as tmp_f:
+                    tmp_f.write(contents)
+                os.replace(tmp_path, self.filename)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._written_generation = generation
 
 
 _DEFAULT_API_URL = "https://api.opensuse.org/"
 
+#: location of the oscrc if ``$XDG_CONFIG_HOME`` is unset or empty
+_DEFAULT_OSCRC_PATH = os.path.join(os.path.expanduser("~/.config"), "osc", "oscrc")
+
 
 @dataclasses.dataclass(frozen=True)
 class BackOff:
@@ -166,9 +557,181 @@ class BackOff:
     #: exponential growth factor between consecutive failures
     increase_factor: float = 2.0
 
+    #: upper bound of the sleep time in seconds
+    max_sleep_time: float = 60.0
+
+    #: sleep for a random time between zero and the exponentially growing
+    #: sleep time ("full jitter"), so that concurrent requests that failed at
+    #: the same time are not retried at the same time again
+    jitter: bool = True
+
+
+def _server_retry_delay(headers: typing.Mapping[str, str]) -> float | None:
+    """Returns the number of seconds the server asked us to wait before
+    retrying the request or ``None`` if it didn't.
+
+    ``Retry-After`` can be either a number of seconds or a HTTP date. If it is
+    absent, but the rate limit is exhausted (``X-RateLimit-Remaining: 0``),
+    then we wait until ``X-RateLimit-Reset``, which is either a delay in
+    seconds or a unix timestamp.
+
+    """
+    if (retry_after := headers.get("Retry-After")) is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(
+                0.0,
+                email.utils.parsedate_to_datetime(retry_after).timestamp()
+                - time.time(),
+            )
+        except (TypeError, ValueError):
+            return None
+
+    if headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            reset = float(headers.get("X-RateLimit-Reset", ""))
+        except ValueError:
+            return None
+        # values this large are timestamps and not delays
+        if reset > 1_000_000_000:
+            reset -= time.time()
+        return max(0.0, reset)
+
+    return None
+
+
+@dataclasses.dataclass
+class BackpressureController:
+    """Limits the number of concurrent requests and adapts that limit to the
+    load of the build service (additive increase, multiplicative decrease).
+
+    The limit grows by :py:attr:`alpha` after each successful request and is
+    multiplied by :py:attr:`beta` after a request that failed with one of the
+    retried status codes (e.g. 429 or 503) or timed out. The latency of the
+    requests is deliberately not taken into account, as long-polling routes
+    like the one used by :py:func:`~py_obs.service.service_wait` are slow by
+    design.
+
+    Use it as an async context manager to wait for a free slot.
+
+    """
+
+    #: upper bound and initial value of the concurrency limit
+    max_concurrency: int = 64
+
+    #: lower bound of the concurrency limit
+    min_concurrency: int = 1
+
+    #: additive increase of the limit after each successful request
+    alpha: float = 0.5
+
+    #: multiplicative decrease of the limit after a failure
+    beta: float = 0.5
+
+    _concurrency: float = dataclasses.field(init=False)
+    _in_flight: int = dataclasses.field(default=0, init=False)
+    _slot_freed: asyncio.Condition = dataclasses.field(
+        default_factory=asyncio.Condition, init=False
+    )
+
+    def __post_init__(self) -> None:
+        self._concurrency = float(self.max_concurrency)
+
+    @property
+    def concurrency(self) -> int:
+        """The current limit of concurrent requests."""
+        return max(self.min_concurrency, int(self._concurrency))
+
+    def on_success(self) -> None:
+        """Record that a request succeeded."""
+        self._concurrency = min(
+            float(self.max_concurrency), self._concurrency + self.alpha
+        )
+
+    def on_error(self) -> None:
+        """Record that a request failed or timed out."""
+        self._concurrency = max(
+            float(self.min_concurrency), self._concurrency * self.beta
+        )
+
+    async def __aenter__(self) -> None:
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self._in_flight < self.concurrency)
+            self._in_flight += 1
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        async with self._slot_freed:
+            self._in_flight -= 1
+            self._slot_freed.notify_all()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_oscrc(path: str, mtime_ns: int, size: int) -> configparser.ConfigParser:
+    # mtime and size are only part of the cache key, so that modifications of
+    # the file are picked up
+    with open(path, "r", encoding="utf-8") as oscrc_f:
+        contents = oscrc_f.read()
+
+    # values are used verbatim, interpolating them is wasted work and breaks
+    # on passwords containing a '%'
+    oscrc = configparser.ConfigParser(default_section="general", interpolation=None)
+    oscrc.read_string(contents, source=path)
+    return oscrc
+
+
+#: connection pools shared by all :py:class:`Osc` instances, one per event loop
+#: and per host connection limit.
+#: The connectors reference their event loop, so this cannot be a
+#: :py:class:`weakref.WeakKeyDictionary`, the entries of closed loops are
+#: removed by :py:func:`_evict_closed_loops` instead.
+_SHARED_CONNECTORS: dict[asyncio.AbstractEventLoop, dict[int, aiohttp.TCPConnector]] = (
+    {}
+)
+
+
+def _evict_closed_loops() -> None:
+    """Remove the connectors of event loops that have been closed (e.g. by
+    :py:func:`asyncio.run`) from :py:data:`_SHARED_CONNECTORS` and close them,
+    so that the loops and the connectors can be garbage collected.
+
+    """
+    for loop in [loop for loop in _SHARED_CONNECTORS if loop.is_closed()]:
+        for connector in _SHARED_CONNECTORS.pop(loop).values():
+            # close() is a coroutine, which cannot be awaited without the
+            # connector's loop. The synchronous part of it (_close()) only
+            # marks the connector as closed and drops its connections if the
+            # loop is closed, there is nothing left to wait for.
+            connector._close()
+
+
+_C = typing.TypeVar("_C")
+
 
 @dataclasses.dataclass
 class Osc:
+    """Connection to a build service instance.
+
+    The HTTP session is created on the first request and reused afterwards. It
+    must be closed once the instance is no longer needed, either via
+    :py:meth:`aclose` or by using the instance as an async context manager:
+
+    .. code-block:: python
+
+       async with Osc.from_oscrc() as osc:
+           ...
+
+    This also writes pending cookie updates to disk. The connections to the
+    build service are pooled across all instances of an event loop and are
+    **not** closed by :py:meth:`aclose`. Await
+    :py:meth:`shutdown_shared_connector` before the event loop ends, otherwise
+    the connections are left open until the loop has been closed and are then
+    only released when an instance is used on the next loop.
+
+    """
+
     username: str = ""
     password: str = ""
     api_url: str = _DEFAULT_API_URL
@@ -181,9 +744,49 @@ class Osc:
     public: bool = False
     cookie_jar_path: str = os.path.expanduser("~/.local/state/osc/cookiejar")
 
-    _cookie_jar: CookieJar = None  # type: ignore[assignment]
+    #: maximum number of simultaneous connections to the build service
+    max_concurrent_per_host: int = 64
+
+    #: maximum number of requests of this instance that are sent at the same
+    #: time, further requests wait until one of them received a response.
+    #: The actual limit is lowered while the build service is overloaded (i.e.
+    #: returns errors or times out), see :py:class:`BackpressureController`.
+    max_concurrent: int = 64
+
+    #: persistent cookie jar, created on the first request as it reads the
+    #: cookies from :py:attr:`cookie_jar_path`
+    _cookie_jar: CookieJar | None = None
     _auth: aiohttp.BasicAuth | SignatureAuth | None = None
 
+    #: private key for signature auth, loaded once on the first 401
+    _ssh_private_key: typing.Any = None
+
+    #: HTTP session that is reused for all requests of this instance, created
+    #: lazily as it must be bound to a running event loop
+    _session: aiohttp.ClientSession | None = dataclasses.field(
+        default=None, repr=False, compare=False
+    )
+    #: limits the number of requests of this instance that are in flight at
+    #: the same time, created together with :py:attr:`_session`
+    _backpressure: BackpressureController | None = dataclasses.field(
+        default=None, repr=False, compare=False
+    )
+    #: serializes the auth negotiation after a 401, created together with
+    #: :py:attr:`_session`
+    _auth_lock: asyncio.Lock | None = dataclasses.field(
+        default=None, repr=False, compare=False
+    )
+    _session_loop: asyncio.AbstractEventLoop | None = dataclasses.field(
+        default=None, repr=False, compare=False
+    )
+    #: caches of the other py_obs modules (e.g. the fetched users in
+    #: :py:mod:`py_obs.person`), which are bound to the credentials of this
+    #: instance and must not be shared with other instances, see
+    #: :py:meth:`cache`
+    _caches: dict[str, typing.Any] = dataclasses.field(
+        default_factory=dict, repr=False, compare=False
+    )
+
     _default_headers: dict[str, str] = dataclasses.field(
         default_factory=lambda: {
             # https://github.com/openSUSE/open-build-service/issues/13737
@@ -191,23 +794,25 @@ class Osc:
         }
     )
 
+    #: realm of the signature auth challenge per API URL, the challenge is
+    #: static and can be reused by new instances
+    _signature_realms: typing.ClassVar[dict[str, str]] = {}
+
     #: status codes on which we retry a request
-    _RETRY_STATUSES: typing.ClassVar[tuple[int, ...]] = (500, 502, 503, 504)
+    _RETRY_STATUSES: typing.ClassVar[frozenset[int]] = frozenset(
+        {408, 429, 500, 502, 503, 504}
+    )
 
     @staticmethod
     def from_oscrc(api_url: str | None = None) -> "Osc":
         """Create a Osc instance from the oscrc config file."""
-        with open(
-            os.path.join(
-                os.getenv("XDG_CONFIG_HOME", os.path.expanduser("~/.config")),
-                "osc",
-                "oscrc",
-            ),
-            "r",
-            encoding="utf-8",
-        ) as oscrc_f:
-            oscrc = configparser.ConfigParser(default_section="general")
-            oscrc.read_file(oscrc_f)
+        # not resolved at import time, as $XDG_CONFIG_HOME may be changed later
+        if xdg_config_home := os.getenv("XDG_CONFIG_HOME"):
+            path = os.path.join(xdg_config_home, "osc", "oscrc")
+        else:
+            path = _DEFAULT_OSCRC_PATH
+        st = os.stat(path)
+        oscrc = _load_oscrc(path, st.st_mtime_ns, st.st_size)
 
         if not api_url:
             try:
@@ -261,10 +866,12 @@ class Osc:
         This function is a wrapper around aiohttp's ``session.request`` but
         performs the following additional steps:
 
-        - retry requests that receive an error 500, 502, 503 or 504 with an
-          exponentially increasing wait time in between (the status codes
+        - retry requests that receive an error 408, 429, 500, 502, 503 or 504
+          with an exponentially increasing wait time in between (the status codes
           defined in :py:attr:`~Osc._RETRY_STATUSES`) using the supplied
-          `backoff` parameter for the exponential backoff
+          `backoff` parameter for the exponential backoff, unless the server
+          specifies how long to wait via ``Retry-After`` (which is capped at
+          :py:attr:`BackOff.max_sleep_time` as well)
 
         - authenticate with the IBS ssh auth
 
@@ -275,109 +882,289 @@ class Osc:
         if self.public:
             route = f"/public{route}"
 
-        LOGGER.debug(
-            "Sending a %s request to %s with the parameters %s and the payload %s",
-            method,
-            route,
-            params,
-            payload,
-        )
-
-        assert (
-            self._cookie_jar is not None
-        ), "_cookie_jar must have been created in __post_init__"
+        # logging caches the result of isEnabledFor() per level, checking it
+        # first avoids building the argument tuple on every request
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Sending a %s request to %s with the parameters %s and the payload %s",
+                method,
+                route,
+                params,
+                payload,
+            )
 
         backoff = backoff or BackOff()
 
-        async with aiohttp.ClientSession(
-            raise_for_status=True,
-            base_url=self.api_url,
-            headers=self._default_headers,
-            cookie_jar=typing.cast(AbstractCookieJar, self._cookie_jar),
-        ) as session:
-            headers = list(self._default_headers.items())
-            for cookie in session.cookie_jar.filter_cookies(URL(self.api_url)):
-                headers.append(cookie)  # type: ignore[arg-type]
-
-            try:
-                sleep_time = backoff.initial_sleep_time
-                resp: None | aiohttp.ClientResponse = None
+        # wrap (and in case of a str: encode) the payload only once instead of
+        # letting aiohttp do it again for every retry and for the request after
+        # a 401, the payload object can be sent multiple times
+        data = aiohttp.payload.get_payload(payload) if payload is not None else None
+
+        # another instance already received the signature challenge from this
+        # server => authenticate right away instead of waiting for a 401
+        if (
+            self._auth is None
+            and self.ssh_key_path
+            and (realm := Osc._signature_realms.get(self.api_url)) is not None
+        ):
+            self._auth = self._signature_auth(realm)
+
+        session = self._get_session()
+        backpressure = self._backpressure
+        assert backpressure is not None
+        # the auth with which the last request was sent, to detect whether
+        # another request renegotiated it in the meantime
+        used_auth = self._auth
+        try:
+            resp: None | aiohttp.ClientResponse = None
 
-                for i in range(backoff.retries):
+            for i in range(backoff.retries):
+                retry_delay: float | None = None
+                # every attempt waits for a slot of its own, so that requests
+                # which sleep before their next retry don't occupy one
+                async with backpressure:
                     try:
+                        used_auth = self._auth
+                        auth, auth_headers = await self._request_auth()
                         resp = await session.request(
                             method=method,
                             params=params,
                             url=route,
-                            data=payload,
-                            headers=headers,
-                            auth=self._auth,
+                            data=data,
+                            headers=auth_headers,
+                            auth=auth,
                         )
                         if resp.status not in Osc._RETRY_STATUSES:
+                            backpressure.on_success()
+                            resp.raise_for_status()
                             return resp
+                        retry_delay = _server_retry_delay(resp.headers)
+                        # consume the (short) error message so that the
+                        # connection goes back into the pool while we wait,
+                        # otherwise it stays occupied by the discarded response
+                        try:
+                            await resp.read()
+                        except aiohttp.ClientError:
+                            resp.release()
                     except asyncio.TimeoutError:
                         pass
 
-                    # don't wait after the last try
-                    if i == backoff.retries - 1:
-                        break
+                    backpressure.on_error()
 
-                    await asyncio.sleep(sleep_time)
-                    sleep_time *= backoff.increase_factor
+                # don't wait after the last try
+                if i == backoff.retries - 1:
+                    break
 
-                if resp is None:
-                    raise RuntimeError(
-                        f"Sending a {method} request to {route} timed out"
+                if retry_delay is None:
+                    retry_delay = min(
+                        backoff.max_sleep_time,
+                        backoff.initial_sleep_time * backoff.increase_factor**i,
                     )
+                    if backoff.jitter:
+                        retry_delay = random.uniform(0, retry_delay)
+                else:
+                    # don't let a misconfigured server stall us for hours
+                    retry_delay = min(retry_delay, backoff.max_sleep_time)
+                await asyncio.sleep(retry_delay)
 
-                resp.raise_for_status()
-                assert False, "This code path must be unreachable"
-
-            except aiohttp.ClientResponseError as cre_exc:
-                if cre_exc.status != 401:
-                    raise ObsException(**cre_exc.__dict__) from cre_exc
-
-                if cre_exc.status == 401 and self.public:
-                    raise ObsException(**cre_exc.__dict__) from cre_exc
-
-                # TODO: lock and run the following code only in 1 thread; other
-                # threads should use session cookies again
-
-                # needed to make mypy happy, in theory cre_exc.headers can have a
-                # different type as well…
-                assert isinstance(cre_exc.headers, CIMultiDictProxy)
-                supported_auth_methods = [
-                    i.split(" ")[0].lower()
-                    for i in (cre_exc.headers).getall("WWW-Authenticate")
-                ]
-                LOGGER.debug(f"Supported auth methods: {supported_auth_methods}")
-
-                for auth_method in supported_auth_methods:
-                    if auth_method == "signature" and self.ssh_key_path:
-                        self._auth = SignatureAuth(
-                            login=self.username,
-                            ssh_key_path=self.ssh_key_path,
-                            response_headers=cre_exc.headers,
-                        )
-                        break
-                    elif auth_method == "basic" and self.password:
-                        self._auth = aiohttp.BasicAuth(
-                            login=self.username, password=self.password
-                        )
-                        break
+            if resp is None:
+                raise RuntimeError(f"Sending a {method} request to {route} timed out")
 
-                if not self._auth:
-                    # we have no suitable auth handler, let's re-raise the original
-                    # exception
-                    raise ObsException(**cre_exc.__dict__) from cre_exc
+            resp.raise_for_status()
+            assert False, "This code path must be unreachable"
+
+        except aiohttp.ClientResponseError as cre_exc:
+            if cre_exc.status != 401:
+                raise ObsException.from_client_response_error(cre_exc) from cre_exc
+
+            if cre_exc.status == 401 and self.public:
+                raise ObsException.from_client_response_error(cre_exc) from cre_exc
+
+            # only one request negotiates the auth, all others that got a
+            # 401 in the meantime wait for it and reuse its result
+            assert self._auth_lock is not None
+            async with self._auth_lock:
+                if self._auth is used_auth:
+                    # needed to make mypy happy, in theory cre_exc.headers can have a
+                    # different type as well…
+                    assert isinstance(cre_exc.headers, CIMultiDictProxy)
+                    challenges = [
+                        _parse_auth_challenge(challenge)
+                        for challenge in cre_exc.headers.getall("WWW-Authenticate")
+                    ]
+                    if LOGGER.isEnabledFor(logging.DEBUG):
+                        LOGGER.debug(
+                            "Supported auth methods: %s",
+                            [scheme for scheme, _ in challenges],
+                        )
 
-                return await session.request(
+                    for auth_method, auth_params in challenges:
+                        if auth_method == "signature" and self.ssh_key_path:
+                            if not (realm := auth_params.get("realm")):
+                                raise RuntimeError(
+                                    "OBS did not send a realm for signature auth"
+                                )
+                            Osc._signature_realms[self.api_url] = realm
+                            self._auth = self._signature_auth(realm)
+                            break
+                        elif auth_method == "basic" and self.password:
+                            self._auth = aiohttp.BasicAuth(
+                                login=self.username, password=self.password
+                            )
+                            break
+
+            if not self._auth:
+                # we have no suitable auth handler, let's re-raise the original
+                # exception
+                raise ObsException.from_client_response_error(cre_exc) from cre_exc
+
+            async with backpressure:
+                auth, auth_headers = await self._request_auth()
+                resp = await session.request(
                     method=method,
                     params=params,
                     url=route,
-                    data=payload,
-                    auth=self._auth,
+                    data=data,
+                    headers=auth_headers,
+                    auth=auth,
                 )
+            try:
+                resp.raise_for_status()
+            except aiohttp.ClientResponseError as auth_exc:
+                raise ObsException.from_client_response_error(auth_exc) from auth_exc
+            return resp
+
+    async def _request_auth(
+        self,
+    ) -> tuple[aiohttp.BasicAuth | None, list[tuple[str, str]]]:
+        # aiohttp calls the synchronous SignatureAuth.encode(), which would
+        # block the event loop while ssh-keygen runs => set the header directly
+        if isinstance(self._auth, SignatureAuth):
+            return None, [("Authorization", await self._auth.encode_async())]
+        return self._auth, []
+
+    def _signature_auth(self, realm: str) -> SignatureAuth:
+        assert self.ssh_key_path
+        # checked once here instead of for every signature, should the key
+        # vanish later on, then signing fails with ssh-keygen's error
+        if not os.path.isfile(self.ssh_key_path):
+            raise RuntimeError(
+                "The specified SSH key file does not exist: " + self.ssh_key_path
+            )
+        if self._ssh_private_key is None:
+            self._ssh_private_key = _load_ssh_private_key(self.ssh_key_path)
+        return SignatureAuth(
+            login=self.username,
+            ssh_key_path=self.ssh_key_path,
+            realm=realm,
+            private_key=self._ssh_private_key,
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            if self._session is not None:
+                # the stale session may belong to another (possibly already
+                # closed) loop, so it cannot be awaited here. It does not own
+                # the shared connector, hence detaching it is all that
+                # close() would do.
+                self._session.detach()
+
+            # the status is checked explicitly in api_request, as retried
+            # responses must not raise
+            cookie_jar: AbstractCookieJar
+            if self.public:
+                # the public routes are unauthenticated, there is no session
+                # cookie to keep track of
+                cookie_jar = aiohttp.DummyCookieJar()
+            else:
+                if self._cookie_jar is None:
+                    self._cookie_jar = CookieJar(self.cookie_jar_path)
+                cookie_jar = typing.cast(AbstractCookieJar, self._cookie_jar)
+
+            self._session = aiohttp.ClientSession(
+                base_url=self.api_url,
+                headers=self._default_headers,
+                cookie_jar=cookie_jar,
+                connector=self._get_connector(),
+                connector_owner=False,
+            )
+            self._backpressure = BackpressureController(
+                max_concurrency=self.max_concurrent
+            )
+            self._auth_lock = asyncio.Lock()
+            self._session_loop = loop
+        return self._session
+
+    def cache(self, name: str, factory: typing.Callable[[], _C]) -> _C:
+        """Return the cache ``name`` of the other py_obs modules, which is
+        created via ``factory`` on first use and bound to this instance.
+
+        """
+        if (cache := self._caches.get(name)) is None:
+            cache = self._caches[name] = factory()
+        return typing.cast(_C, cache)
+
+    async def aclose(self) -> None:
+        """Save the cookies and close the HTTP session of this instance. The
+        connections to the build service stay in the shared pool, see
+        :py:meth:`shutdown_shared_connector`.
+
+        """
+        if self._cookie_jar is not None:
+            self._cookie_jar.flush()
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._backpressure = None
+            self._auth_lock = None
+            self._session_loop = None
+
+    async def __aenter__(self) -> "Osc":
+        return self
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        await self.aclose()
+
+    def _get_connector(self) -> aiohttp.TCPConnector:
+        # The connector outlives the individual sessions and Osc instances so
+        # that connections (including their TLS state) and DNS lookups are
+        # reused between requests. It also bounds how many requests are sent
+        # concurrently. A connector is bound to the event loop it was created
+        # on, hence we keep one per loop.
+        _evict_closed_loops()
+        connectors = _SHARED_CONNECTORS.setdefault(asyncio.get_running_loop(), {})
+        connector = connectors.get(self.max_concurrent_per_host)
+        if connector is None or connector.closed:
+            connector = connectors[self.max_concurrent_per_host] = aiohttp.TCPConnector(
+                limit=max(128, self.max_concurrent_per_host),
+                limit_per_host=self.max_concurrent_per_host,
+                keepalive_timeout=75,
+                ttl_dns_cache=600,
+            )
+        return connector
+
+    @staticmethod
+    async def shutdown_shared_connector() -> None:
+        """Close all connections to the build service that are kept open for
+        reuse by the :py:class:`Osc` instances of the running event loop.
+
+        Call this before the event loop ends (e.g. at the end of the coroutine
+        passed to :py:func:`asyncio.run`), the connections cannot be closed
+        properly afterwards. The connections of event loops that have been
+        closed in the meantime are released as well.
+
+        """
+        _evict_closed_loops()
+        for connector in _SHARED_CONNECTORS.pop(
+            asyncio.get_running_loop(), {}
+        ).values():
+            await connector.close()
 
     @staticmethod
     async def _raise_for_status(resp: aiohttp.ClientResponse) -> None:
@@ -398,5 +1185,3 @@ class Osc:
             )
         if self.password:
             self._auth = aiohttp.BasicAuth(login=self.username, password=self.password)
-
-        self._cookie_jar = CookieJar(self.cookie_jar_path)
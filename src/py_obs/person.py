@@ -1,6 +1,18 @@
+import asyncio
+from collections import OrderedDict
 import enum
 from dataclasses import dataclass, field
-from typing import ClassVar
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Coroutine,
+    Final,
+    Generic,
+    TypeVar,
+)
 
 from py_obs.osc import Osc
 from py_obs.xml_factory import MetaMixin, StrElementField
@@ -13,7 +25,7 @@ class PersonRole(enum.StrEnum):
     READER = enum.auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Person(MetaMixin):
     userid: str
     role: PersonRole = PersonRole.MAINTAINER
@@ -21,7 +33,7 @@ class Person(MetaMixin):
     _element_name: ClassVar[str] = "person"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Person2(MetaMixin):
     name: str
     role: PersonRole = PersonRole.MAINTAINER
@@ -32,7 +44,7 @@ class Person2(MetaMixin):
         return Person(userid=self.name, role=self.role)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class User(MetaMixin):
     login: StrElementField
     email: StrElementField | None
@@ -42,16 +54,16 @@ class User(MetaMixin):
     _element_name: ClassVar[str] = "person"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserGroup(MetaMixin):
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class GroupMaintainer(MetaMixin):
         _element_name: ClassVar[str] = "maintainer"
         userid: str
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class GroupPerson(MetaMixin):
-        @dataclass(frozen=True)
+        @dataclass(frozen=True, slots=True)
         class GroupPersonEntry(MetaMixin):
             _element_name: ClassVar[str] = "person"
             userid: str
@@ -68,7 +80,7 @@ class UserGroup(MetaMixin):
     _element_name: ClassVar[str] = "group"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Group(MetaMixin):
     _element_name: ClassVar[str] = "group"
 
@@ -76,19 +88,130 @@ class Group(MetaMixin):
     role: PersonRole = PersonRole.MAINTAINER
 
 
-async def fetch_user(osc: Osc, username: str) -> User:
-    return await User.from_response(
-        await osc.api_request(f"/person/{username}", method="GET")
+#: number of seconds for which fetched users and groups are reused
+_CACHE_TTL: Final = 60.0
+
+#: maximum number of users and groups that are cached per :py:class:`Osc`
+#: instance, the least recently used ones are dropped first
+_CACHE_MAXSIZE: Final = 1024
+
+T = TypeVar("T")
+_M = TypeVar("_M", bound=MetaMixin)
+
+
+class _FetchCache(Generic[T]):
+    """Users or groups fetched via one :py:class:`Osc` instance with the time
+    at which they were fetched, keyed by their name.
+
+    """
+
+    __slots__ = ("_entries", "_in_flight")
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, tuple[float, T]] = OrderedDict()
+        #: fetches that are currently in flight, so that concurrent calls for
+        #: the same name share one request. A task can only be awaited on the
+        #: loop that it was created on, hence they are keyed by it as well.
+        self._in_flight: dict[
+            tuple[asyncio.AbstractEventLoop, str], "asyncio.Task[T]"
+        ] = {}
+
+    def get(self, name: str) -> T | None:
+        if (entry := self._entries.get(name)) is not None:
+            if time.monotonic() - entry[0] < _CACHE_TTL:
+                self._entries.move_to_end(name)
+                return entry[1]
+            del self._entries[name]
+        return None
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def put(self, name: str, value: T) -> None:
+        self._entries[name] = (time.monotonic(), value)
+        self._entries.move_to_end(name)
+        if len(self._entries) > _CACHE_MAXSIZE:
+            self._entries.popitem(last=False)
+
+    def join(
+        self, name: str, fetch: Callable[[], Coroutine[Any, Any, T]]
+    ) -> Awaitable[T]:
+        """Return the fetch of ``name`` that is in flight on the running loop
+        or start a new one via ``fetch``.
+
+        """
+        key = (asyncio.get_running_loop(), name)
+        if (task := self._in_flight.get(key)) is None:
+            task = self._in_flight[key] = asyncio.create_task(fetch())
+            # removed once the request is done, independently of whether and
+            # when the callers resume
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # a caller that is cancelled must not cancel the request of the others
+        return asyncio.shield(task)
+
+
+def _user_cache(osc: Osc) -> _FetchCache[User]:
+    return osc.cache("users", _FetchCache[User])
+
+
+def _group_cache(osc: Osc) -> _FetchCache[UserGroup]:
+    return osc.cache("groups", _FetchCache[UserGroup])
+
+
+def clear_cache(osc: Osc) -> None:
+    """Forget all users and groups that were fetched via ``osc``."""
+    _user_cache(osc).clear()
+    _group_cache(osc).clear()
+
+
+async def _fetch_cached(
+    osc: Osc,
+    cache: _FetchCache[_M],
+    cls: type[_M],
+    route: str,
+    name: str,
+    use_cache: bool,
+) -> _M:
+    """Fetch ``name`` from ``route`` as an instance of ``cls`` via
+    ``cache``, see :py:func:`fetch_user`.
+
+    """
+    if use_cache and (value := cache.get(name)) is not None:
+        return value
+
+    async def _fetch() -> _M:
+        value = await cls.from_response(await osc.api_request(route, method="GET"))
+        cache.put(name, value)
+        return value
+
+    if not use_cache:
+        return await _fetch()
+    return await cache.join(name, _fetch)
+
+
+async def fetch_user(osc: Osc, username: str, use_cache: bool = True) -> User:
+    """Fetch the user with the supplied name. The result is reused for
+    further calls via ``osc`` within a minute, unless ``use_cache`` is
+    ``False``. Concurrent calls share one request.
+
+    """
+    return await _fetch_cached(
+        osc, _user_cache(osc), User, f"/person/{username}", username, use_cache
     )
 
 
-async def fetch_group(osc: Osc, groupname: str) -> UserGroup:
-    return await UserGroup.from_response(
-        await osc.api_request(f"/group/{groupname}", method="GET")
+async def fetch_group(osc: Osc, groupname: str, use_cache: bool = True) -> UserGroup:
+    """Fetch the group with the supplied name. The result is reused for
+    further calls via ``osc`` within a minute, unless ``use_cache`` is
+    ``False``. Concurrent calls share one request.
+
+    """
+    return await _fetch_cached(
+        osc, _group_cache(osc), UserGroup, f"/group/{groupname}", groupname, use_cache
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Owner(MetaMixin):
     project: str
     package: str | None = None
@@ -100,7 +223,7 @@ class Owner(MetaMixin):
     _element_name: ClassVar[str] = "owner"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OwnerCollection(MetaMixin):
     _element_name: ClassVar[str] = "collection"
 
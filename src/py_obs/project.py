@@ -1,10 +1,10 @@
 import asyncio
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
-from typing import ClassVar, cast, overload
+from typing import Any, Awaitable, Callable, ClassVar, overload
 import xml.etree.ElementTree as ET
 
-from py_obs.osc import Osc
+from py_obs.osc import ObsException, Osc
 from py_obs.person import (
     OwnerCollection,
     Person,
@@ -14,10 +14,16 @@ from py_obs.person import (
     fetch_group,
 )
 from py_obs.status import Status
-from .xml_factory import MetaMixin, StrElementField
+from .xml_factory import (
+    MetaMixin,
+    StrElementField,
+    iter_child_elements,
+    parse_response,
+    serialize_xml,
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PathEntry(MetaMixin):
     project: str
     repository: str
@@ -39,7 +45,7 @@ class RebuildMode(StrEnum):
     LOCAL = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Repository(MetaMixin):
     name: str
     rebuild: RebuildMode | None = None
@@ -49,7 +55,7 @@ class Repository(MetaMixin):
     _element_name: ClassVar[str] = "repository"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DevelProject(MetaMixin):
     project: str
     package: str
@@ -57,7 +63,7 @@ class DevelProject(MetaMixin):
     _element_name: ClassVar[str] = "devel"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Project(MetaMixin):
     name: str
     title: StrElementField
@@ -69,7 +75,7 @@ class Project(MetaMixin):
     _element_name: ClassVar[str] = "project"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Package(MetaMixin):
     name: str
     title: StrElementField
@@ -83,12 +89,18 @@ class Package(MetaMixin):
     _element_name: ClassVar[str] = "package"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackageMaintainers:
     package: list[Person2] = field(default_factory=list)
     project: list[Person2] = field(default_factory=list)
 
 
+def _group_members(group: UserGroup) -> list[Person2]:
+    return [Person2(maint.userid) for maint in group.maintainer] + [
+        Person2(pers.userid) for pers in group.person.person
+    ]
+
+
 @overload
 async def search_for_maintainers(
     osc: Osc,
@@ -142,31 +154,47 @@ async def search_for_maintainers(
         await osc.api_request("/search/owner", method="GET", params=params)
     )
 
-    pkg_maintainers = []
-    prj_maintainers = []
+    pkg_maintainers: list[Person2] = []
+    prj_maintainers: list[Person2] = []
+    # the maintainer list to which the members of the groups are added
+    group_owners: list[tuple[list[Person2], list[str]]] = []
     for owner in owners.owner:
+        if not owner.project:
+            continue
+
+        if owner.package == pkg_name:
+            maintainers = pkg_maintainers
+        elif not owner.package:
+            maintainers = prj_maintainers
+        else:
+            continue
+
+        maintainers.extend(owner.person)
+        group_owners.append(
+            (
+                maintainers,
+                [grp.name for grp in owner.group if grp.name not in groups_to_ignore],
+            )
+        )
 
-        async def fetch_group_members() -> list[Person2]:
-            tasks = []
-            for grp in owner.group:
-                if grp.name not in groups_to_ignore:
-                    tasks.append(fetch_group(osc, grp.name))
-
-            res = cast(tuple[UserGroup], await asyncio.gather(*tasks))
-            return [
-                Person2(maint.userid) for grp in res for maint in grp.maintainer
-            ] + [Person2(pers.userid) for grp in res for pers in grp.person.person]
-
-        if owner.project and owner.package == pkg_name:
-            pkg_maintainers.extend(owner.person)
-            pkg_maintainers.extend(await fetch_group_members())
-
-        if owner.project and not owner.package:
-            prj_maintainers.extend(owner.person)
-            prj_maintainers.extend(await fetch_group_members())
+    # fetch the groups of all owners at once and every group only once
+    group_names = list(
+        dict.fromkeys(name for _, names in group_owners for name in names)
+    )
+    groups = dict(
+        zip(
+            group_names,
+            await asyncio.gather(*(fetch_group(osc, name) for name in group_names)),
+        )
+    )
+    for maintainers, names in group_owners:
+        for name in names:
+            maintainers.extend(_group_members(groups[name]))
 
+    # drop duplicates, but keep the order in which OBS reported the maintainers
     return PackageMaintainers(
-        package=list(set(pkg_maintainers)), project=list(set(prj_maintainers))
+        package=list(dict.fromkeys(pkg_maintainers)),
+        project=list(dict.fromkeys(prj_maintainers)),
     )
 
 
@@ -198,26 +226,22 @@ async def send_meta(
     pkg_name: str | None = None,
     pkg_meta: ET.Element | None = None,
 ) -> None:
-    route = "/source/"
-
     if prj and pkg:
-        route += f"{prj.name}/{pkg.name}"
+        route = f"/source/{prj.name}/{pkg.name}/_meta"
         meta = pkg.meta
     elif prj and not pkg:
-        route += prj.name
+        route = f"/source/{prj.name}/_meta"
         meta = prj.meta
     elif prj_name and pkg_name and pkg_meta:
-        route += f"{prj_name}/{pkg_name}"
+        route = f"/source/{prj_name}/{pkg_name}/_meta"
         meta = pkg_meta
     elif prj_name and prj_meta:
-        route += prj_name
+        route = f"/source/{prj_name}/_meta"
         meta = prj_meta
     else:
         assert False, "Invalid parameter combination"
 
-    route += "/_meta"
-
-    await osc.api_request(route=route, payload=ET.tostring(meta), method="PUT")
+    await osc.api_request(route=route, payload=serialize_xml(meta), method="PUT")
 
 
 @overload
@@ -237,10 +261,11 @@ async def delete(
     pkg: Package | str | None = None,
     force: bool = False,
 ) -> None:
-    prj_name = prj.name if isinstance(prj, Project) else prj
-    route = f"/source/{prj_name}/"
+    prj_name = prj if isinstance(prj, str) else prj.name
     if pkg:
-        route += pkg.name if isinstance(pkg, Package) else pkg
+        route = f"/source/{prj_name}/{pkg if isinstance(pkg, str) else pkg.name}"
+    else:
+        route = f"/source/{prj_name}/"
 
     await osc.api_request(
         route, method="DELETE", params={"force": "1"} if force else None
@@ -265,22 +290,105 @@ async def fetch_meta(
     whether the ``pkg`` parameter was supplied or not.
 
     """
-    route = f"/source/{prj.name if isinstance(prj, Project) else prj}"
+    prj_name = prj if isinstance(prj, str) else prj.name
 
     if pkg:
-        route += f"/{pkg.name if isinstance(pkg, Package) else pkg}"
+        pkg_name = pkg if isinstance(pkg, str) else pkg.name
+        return await Package.from_response(
+            await osc.api_request(f"/source/{prj_name}/{pkg_name}/_meta")
+        )
 
-    route += "/_meta"
+    return await Project.from_response(
+        await osc.api_request(f"/source/{prj_name}/_meta")
+    )
 
-    if pkg:
-        return await Package.from_response(await osc.api_request(route))
 
-    return await Project.from_response(await osc.api_request(route))
+#: maximum number of packages that are looked up by a single search request,
+#: limits the length of the query string
+_MAX_PACKAGES_PER_SEARCH = 50
+
 
+def _xpath_literal(value: str) -> str:
+    """Quote ``value`` as a XPath string literal. XPath 1.0 has no escape
+    sequences, so a value containing both kinds of quotes is built via
+    ``concat()``.
 
-@dataclass(frozen=True)
+    """
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat('" + "', \"'\", '".join(value.split("'")) + "')"
+
+
+async def _search_packages(
+    osc: Osc, prj_name: str, pkg_names: list[str]
+) -> list[Package]:
+    match = (
+        f"@project={_xpath_literal(prj_name)} and ("
+        + " or ".join(f"@name={_xpath_literal(name)}" for name in pkg_names)
+        + ")"
+    )
+    resp = await osc.api_request("/search/package", params={"match": match})
+    return [pkg async for pkg in Package.from_response_stream(resp, "collection")]
+
+
+async def _fetch_meta_if_exists(
+    osc: Osc, prj_name: str, pkg_name: str
+) -> Package | None:
+    try:
+        return await fetch_meta(osc, prj=prj_name, pkg=pkg_name)
+    except ObsException as obs_exc:
+        if obs_exc.status == 404:
+            return None
+        raise
+
+
+async def fetch_meta_many(
+    osc: Osc, *, prj: Project | str, pkgs: list[Package | str]
+) -> list[Package]:
+    """Fetch the config (aka the ``_meta``) of multiple packages of the
+    project ``prj``.
+
+    Unlike calling :py:func:`fetch_meta` for every package, this looks up the
+    packages via the search API in one request per 50 packages. The result is
+    in the order of ``pkgs``, packages that do not exist are omitted.
+
+    The search API is not available via the public routes, if
+    :py:attr:`~py_obs.osc.Osc.public` is set, then :py:func:`fetch_meta` is
+    called for every package instead.
+
+    """
+    prj_name = prj if isinstance(prj, str) else prj.name
+    pkg_names = [pkg if isinstance(pkg, str) else pkg.name for pkg in pkgs]
+
+    if osc.public:
+        return [
+            pkg
+            for pkg in await asyncio.gather(
+                *(_fetch_meta_if_exists(osc, prj_name, name) for name in pkg_names)
+            )
+            if pkg is not None
+        ]
+
+    found = {
+        pkg.name: pkg
+        for chunk in await asyncio.gather(
+            *(
+                _search_packages(
+                    osc, prj_name, pkg_names[i : i + _MAX_PACKAGES_PER_SEARCH]
+                )
+                for i in range(0, len(pkg_names), _MAX_PACKAGES_PER_SEARCH)
+            )
+        )
+        for pkg in chunk
+    }
+    return [found[name] for name in pkg_names if name in found]
+
+
+@dataclass(frozen=True, slots=True)
 class _Directory(MetaMixin):
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class Entry(MetaMixin):
         _element_name: ClassVar[str] = "entry"
 
@@ -294,7 +402,7 @@ class _Directory(MetaMixin):
         recommended: bool | None
         hash: str | None
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class LinkInfo(MetaMixin):
         _element_name: ClassVar[str] = "linkinfo"
 
@@ -307,7 +415,7 @@ class _Directory(MetaMixin):
         lsrcmd5: str | None
         error: str | None
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class ServiceInfo(MetaMixin):
         _element_name: ClassVar[str] = "serviceinfo"
         code: str | None
@@ -329,9 +437,11 @@ class _Directory(MetaMixin):
 
 
 def _prj_and_pkg_name(prj: str | Project, pkg: Package | str) -> tuple[str, str]:
+    # check for str and not for Project/Package: isinstance() against
+    # MetaMixin subclasses goes through the slow ABCMeta.__instancecheck__
     return (
-        prj.name if isinstance(prj, Project) else prj,
-        pkg.name if isinstance(pkg, Package) else pkg,
+        prj if isinstance(prj, str) else prj.name,
+        pkg if isinstance(pkg, str) else pkg.name,
     )
 
 
@@ -344,31 +454,30 @@ async def fetch_package_list(
     packages are not shown and only the main package names are displayed.
 
     """
+    resp = await osc.api_request(
+        f"/source/{project if isinstance(project, str) else project.name}"
+    )
+    # only the name and the origin package of the entries are needed, so read
+    # them directly instead of creating a _Directory.Entry for each one
     dentries = [
-        entry
-        for entry in (
-            await _Directory.from_response(
-                await osc.api_request(
-                    f"/source/{project.name if isinstance(project, Project) else project}"
-                )
-            )
-        ).entry
+        (entry.get("name"), entry.get("originpackage"))
+        async for entry in iter_child_elements(resp, _Directory._element_name)
+        if entry.tag == _Directory.Entry._element_name
     ]
 
     if not exclude_multibuild_flavors:
-        return [d.name for d in dentries if d.name]
+        return [name for name, _ in dentries if name]
 
     res = []
-    for dentry in dentries:
-        if dentry.name:
-            if ":" in dentry.name and dentry.originpackage:
-                res.append(dentry.originpackage)
-            else:
-                res.append(dentry.name.partition(":")[0])
-    return list(set(res))
+    for name, originpackage in dentries:
+        if name:
+            # multibuild flavors are named $pkg:$flavor
+            main_name, is_flavor, _ = name.partition(":")
+            res.append(originpackage if is_flavor and originpackage else main_name)
+    return list(dict.fromkeys(res))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class File:
     #: The file name
     name: str
@@ -389,16 +498,15 @@ async def fetch_file_list(
     """Fetch the list of files of a package in the given project."""
     prj_name, pkg_name = _prj_and_pkg_name(prj, pkg)
 
+    resp = await osc.api_request(
+        route=f"/source/{prj_name}/{pkg_name}",
+        params={"expand": "1"} if expand_links else None,
+    )
     return [
         File(name=entry.name, md5_sum=entry.md5, size=entry.size, mtime=entry.mtime)
-        for entry in (
-            await _Directory.from_response(
-                await osc.api_request(
-                    route=f"/source/{prj_name}/{pkg_name}",
-                    params={"expand": "1"} if expand_links else None,
-                )
-            )
-        ).entry
+        async for entry in _Directory.Entry.from_response_stream(
+            resp, _Directory._element_name
+        )
         if entry.name and entry.md5 and entry.size and entry.mtime
     ]
 
@@ -412,7 +520,7 @@ async def fetch_file_contents(
 ) -> bytes:
     """Fetch the contents of a file on OBS"""
     prj_name, pkg_name = _prj_and_pkg_name(prj, pkg)
-    fname = file.name if isinstance(file, File) else file
+    fname = file if isinstance(file, str) else file.name
 
     return await (
         await osc.api_request(
@@ -422,6 +530,34 @@ async def fetch_file_contents(
     ).read()
 
 
+async def fetch_file_contents_to(
+    osc: Osc,
+    prj: str | Project,
+    pkg: Package | str,
+    file: str | File,
+    writer: Callable[[bytes], Awaitable[Any]],
+    expand_links: bool = True,
+) -> None:
+    """Fetch the contents of a file on OBS and pass them to ``writer`` in
+    chunks as they are received, instead of collecting the whole file in
+    memory like :py:func:`fetch_file_contents`.
+
+    """
+    prj_name, pkg_name = _prj_and_pkg_name(prj, pkg)
+    fname = file if isinstance(file, str) else file.name
+
+    resp = await osc.api_request(
+        f"/source/{prj_name}/{pkg_name}/{fname}",
+        params={"expand": "1"} if expand_links else None,
+    )
+    try:
+        # iter_any() hands out the received buffers as they are
+        async for chunk in resp.content.iter_any():
+            await writer(chunk)
+    finally:
+        resp.release()
+
+
 async def upload_file_contents(
     osc: Osc,
     prj: str | Project,
@@ -435,7 +571,7 @@ async def upload_file_contents(
 
     """
     prj_name, pkg_name = _prj_and_pkg_name(prj, pkg)
-    fname = file.name if isinstance(file, File) else file
+    fname = file if isinstance(file, str) else file.name
 
     await osc.api_request(
         f"/source/{prj_name}/{pkg_name}/{fname}",
@@ -451,20 +587,15 @@ async def fetch_all_files(
     """Retrieve all files for the given package. Returns a dictionary where the
     file name is the key and the file contents the value.
 
-    """
-    res = {}
-
-    tasks = []
-    for file in await fetch_file_list(osc, prj, pkg, expand_links):
-
-        async def _fetch_cur_file(f: File) -> None:
-            res[f.name] = await fetch_file_contents(osc, prj, pkg, f, expand_links)
+    The files are fetched concurrently, at most
+    :py:attr:`~py_obs.osc.Osc.max_concurrent` at a time.
 
-        tasks.append(_fetch_cur_file(file))
-
-    await asyncio.gather(*tasks)
-
-    return res
+    """
+    files = await fetch_file_list(osc, prj, pkg, expand_links)
+    contents = await asyncio.gather(
+        *(fetch_file_contents(osc, prj, pkg, f, expand_links) for f in files)
+    )
+    return {f.name: content for f, content in zip(files, contents)}
 
 
 async def fetch_package_diff(
@@ -507,6 +638,31 @@ async def fetch_package_diff(
     ).decode()
 
 
+async def fetch_package_diffs(
+    osc: Osc,
+    prj: str | Project,
+    pkg: Package | str,
+    revisions: list[int | str],
+    expand_links: bool = True,
+    limit_to_files: list[str] | None = None,
+) -> list[str]:
+    """Fetch the server side rendered diffs of multiple revisions of a package
+    concurrently and return them in the order of ``revisions``.
+
+    The parameters are the same as for :py:func:`fetch_package_diff`.
+    """
+    return list(
+        await asyncio.gather(
+            *(
+                fetch_package_diff(
+                    osc, prj, pkg, expand_links, limit_to_files, revision
+                )
+                for revision in revisions
+            )
+        )
+    )
+
+
 async def branch_package(
     osc: Osc,
     prj: str | Project,
@@ -556,7 +712,7 @@ async def branch_package(
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackageSourceInfo(MetaMixin):
     """Source information of a rpm-spec based package."""
 
@@ -598,7 +754,7 @@ class PackageSourceInfo(MetaMixin):
     _element_name: ClassVar[str] = "sourceinfo"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _BrokenPackageSourceInfo(MetaMixin):
     """Required due to
     https://github.com/openSUSE/open-build-service/issues/16233.
@@ -626,16 +782,17 @@ async def fetch_package_info(
     """
     prj_name, pkg_name = _prj_and_pkg_name(prj, pkg)
 
-    data = await (
+    # parsed only once, the tree is reused for the error response
+    sourceinfo = await parse_response(
         await osc.api_request(
             f"/source/{prj_name}/{pkg_name}", params={"view": "info", "parse": "1"}
         )
-    ).read()
+    )
 
     try:
-        return PackageSourceInfo.from_xml(data)
+        return PackageSourceInfo.from_xml(sourceinfo)
     except (ValueError, KeyError):
-        err = (_BrokenPackageSourceInfo.from_xml(data)).error
+        err = (_BrokenPackageSourceInfo.from_xml(sourceinfo)).error
         raise ValueError(
             f"OBS could not parse the package {prj_name}/{pkg_name}: {err}"
         )
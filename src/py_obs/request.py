@@ -2,15 +2,20 @@ import asyncio
 import enum
 from urllib.parse import urlencode
 import xml.etree.ElementTree as ET
-from dataclasses import Field, dataclass, field
-from typing import ClassVar, NoReturn, TypeVar, overload
+from dataclasses import dataclass, field
+from typing import ClassVar, NoReturn, overload
 import typing
 from py_obs.history import fetch_package_history
 from py_obs.osc import Osc
 from py_obs.person import Person2
 
 from py_obs.project import Package, Person, PersonRole, Project
-from .xml_factory import MetaMixin, StrElementField
+from .xml_factory import MetaMixin, StrElementField, serialize_xml
+
+
+#: looks the role up in a dictionary of the members instead of going through
+#: the comparatively slow ``PersonRole(value)``
+_role_from_attrib = MetaMixin._converter("role", PersonRole)
 
 
 @enum.unique
@@ -87,9 +92,6 @@ class Options(MetaMixin):
     _element_name: ClassVar[str] = "options"
 
 
-T = TypeVar("T")
-
-
 @dataclass(frozen=True)
 class RequestAction(MetaMixin):
     type: RequestActionType
@@ -111,23 +113,21 @@ class RequestAction(MetaMixin):
     # #: accepted.
     # accept_info: AcceptInfo | None
 
-    def field_transformer(
-        self, field: Field[typing.Any]
-    ) -> tuple[T, str, typing.Type[T]]:
-        if field.name == "person":
-            pers = (
-                Person2(name=self.person.userid, role=self.person.role)
-                if self.person
-                else None
-            )
-            return pers, "person", Person2 | None  # type: ignore
-        return super().field_transformer(field)
+    def _person_to_xml(self) -> tuple[Person2 | None, str, typing.Any]:
+        pers = (
+            Person2(name=self.person.userid, role=self.person.role)
+            if self.person
+            else None
+        )
+        return pers, "person", Person2 | None
+
+    _field_transformers = {"person": _person_to_xml}
 
     @staticmethod
     def _person_from_entry(xml_element: ET.Element) -> Person | None:
         elem = xml_element.find("person")
         if elem:
-            return Person(elem.attrib["name"], role=PersonRole(elem.attrib["role"]))
+            return Person(elem.attrib["name"], role=_role_from_attrib(elem))
         return None
 
     _field_converters: typing.ClassVar[
@@ -148,16 +148,14 @@ class RequestState(MetaMixin):
     comment: StrElementField | None = None
     approver: str | None = None
 
-    def field_transformer(
-        self, field: Field[typing.Any]
-    ) -> tuple[T, str, typing.Type[T]]:
-        if field.name == "state":
-            return self.state, "name", RequestStatus  # type: ignore
-        return super().field_transformer(field)
+    def _state_to_xml(self) -> tuple[RequestStatus, str, typing.Any]:
+        return self.state, "name", RequestStatus
+
+    _field_transformers = {"state": _state_to_xml}
 
     _field_converters: typing.ClassVar[
         dict[str, typing.Callable[[ET.Element], typing.Any]] | None
-    ] = {"state": lambda elem: RequestStatus(elem.attrib["name"])}
+    ] = {"state": MetaMixin._converter("name", RequestStatus)}
 
     _element_name: ClassVar[str] = "state"
 
@@ -197,22 +195,15 @@ class Request(MetaMixin):
     _element_name: ClassVar[str] = "request"
 
 
-@dataclass(frozen=True)
-class _RequestCollection(MetaMixin):
-    matches: int
-
-    request: list[Request] = field(default_factory=list)
-
-    _element_name: typing.ClassVar[str] = "collection"
-
-
 def _request_base_route(
     request: Request | None = None, request_id: int | None = None
 ) -> str:
-    assert request or request_id
-    if request is not None and request.id is None:
-        raise ValueError("Cannot handle a request without an id")
-    return f"/request/{request.id if request else request_id}"
+    if request is not None:
+        if (request_id := request.id) is None:
+            raise ValueError("Cannot handle a request without an id")
+    elif request_id is None:
+        raise ValueError("Either a request or a request id must be provided")
+    return f"/request/{request_id}"
 
 
 @overload
@@ -271,7 +262,6 @@ async def search_for_requests(
     - roles of the request creator
     - request type
     """
-    route = "/request?view=collection"
     query: list[tuple[str, str]] = [("view", "collection")]
 
     assert user or project or package or states or roles or ids or types
@@ -282,27 +272,24 @@ async def search_for_requests(
     if user:
         query.append(("user", user))
     if project:
-        query.append(
-            ("project", project.name if isinstance(project, Project) else project)
-        )
+        query.append(("project", project if isinstance(project, str) else project.name))
     if package:
-        query.append(
-            ("package", package.name if isinstance(package, Package) else package)
-        )
+        query.append(("package", package if isinstance(package, str) else package.name))
+    # the enum members are strings already and can be joined directly
     if states:
-        query.append(("states", ",".join(str(s) for s in states)))
+        query.append(("states", ",".join(states)))
     if roles:
-        query.append(("roles", ",".join(str(r) for r in roles)))
+        query.append(("roles", ",".join(roles)))
     if ids:
         query.append(("ids", ",".join(str(id) for id in ids)))
     if types:
-        query.append(("types", ",".join(str(t) for t in types)))
+        query.append(("types", ",".join(types)))
 
     route = f"/request?{urlencode(query=query)}"
 
     res = await osc.api_request(route=route, method="GET")
 
-    return _RequestCollection.from_xml(ET.fromstring(await res.read())).request
+    return [rq async for rq in Request.from_response_stream(res, "collection")]
 
 
 @enum.unique
@@ -391,10 +378,10 @@ async def submit_package(
         route="/request/",
         params={"cmd": "create"},
         method="POST",
-        payload=ET.tostring(rq.meta),
+        payload=serialize_xml(rq.meta),
     )
 
-    created_request = Request.from_xml(ET.fromstring(await res.read()))
+    created_request = await Request.from_response(res)
 
     to_supersede_ids = []
 
@@ -421,18 +408,20 @@ async def submit_package(
         else:
             to_supersede_ids.append(req)
 
-    tasks = []
-    for rq_id in set(to_supersede_ids):
-        route = f"/request/{rq_id}?" + urlencode(
-            query=[
-                ("cmd", "changestate"),
-                ("newstate", RequestStatus.SUPERSEDED),
-                ("superseded_by", created_request.id),
-            ]
+    # the query is the same for every superseded request, only the id differs
+    query = urlencode(
+        query=[
+            ("cmd", "changestate"),
+            ("newstate", RequestStatus.SUPERSEDED),
+            ("superseded_by", created_request.id),
+        ]
+    )
+    await asyncio.gather(
+        *(
+            osc.api_request(method="POST", route=f"/request/{rq_id}?{query}")
+            for rq_id in dict.fromkeys(to_supersede_ids)
         )
-        tasks.append(osc.api_request(method="POST", route=route))
-
-    await asyncio.gather(*tasks)
+    )
 
     return created_request
 
@@ -457,10 +446,8 @@ async def change_state(
     new_state: RequestStatus,
     comment: str | None = None,
 ) -> None:
-    assert request or request_id
-
     route = _request_base_route(request, request_id)
-    params = {"cmd": "changestate", "newstate": str(new_state)}
+    params: dict[str, str] = {"cmd": "changestate", "newstate": new_state}
     if comment:
         params["comment"] = comment
 
@@ -482,8 +469,6 @@ async def delete(
     request_id: int | None = None,
     comment: str | None = None,
 ) -> None:
-    assert request or request_id
-
     await osc.api_request(
         route=_request_base_route(request, request_id),
         method="DELETE",
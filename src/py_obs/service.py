@@ -9,8 +9,8 @@ async def service_wait(
     project to finish.
 
     """
-    prj_name = project.name if isinstance(project, Project) else project
-    pkg_name = package.name if isinstance(package, Package) else package
+    prj_name = project if isinstance(project, str) else project.name
+    pkg_name = package if isinstance(package, str) else package.name
     # https://api.opensuse.org/apidocs/index#/Sources%20-%20Packages/post_source__project_name___package_name__cmd_waitservice
     await osc.api_request(
         f"/source/{prj_name}/{pkg_name}?cmd=waitservice",
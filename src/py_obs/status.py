@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import ClassVar, Type
 import xml.etree.ElementTree as ET
 
-from py_obs.xml_factory import MetaMixin, StrElementField
+from py_obs.xml_factory import MetaMixin, StrElementField, parse_xml
 
 
 @dataclass(frozen=True)
@@ -21,30 +21,25 @@ class Status(MetaMixin):
 
     @classmethod
     def from_xml(cls: Type["Status"], xml: ET.Element | str | bytes) -> "Status":
-        xml_element = ET.fromstring(xml) if isinstance(xml, (str, bytes)) else xml
+        xml_element = parse_xml(xml) if isinstance(xml, (str, bytes)) else xml
         summary = None
         details = None
         data: dict[str, list[str]] = {}
 
-        if (
-            summary_elem := xml_element.find("summary")
-        ) is not None and summary_elem.text:
-            summary = StrElementField(summary_elem.text)
-
-        if (
-            details_elem := xml_element.find("details")
-        ) is not None and details_elem.text:
-            details = StrElementField(details_elem.text)
-
-        for data_elem in xml_element.findall("data"):
-            if not data_elem.text:
+        # walk over the children once instead of searching for every tag
+        for child in xml_element:
+            if not (text := child.text):
                 continue
 
-            if "name" in data_elem.attrib:
-                if (name := data_elem.attrib["name"]) in data:
-                    data[name].append(data_elem.text)
-                else:
-                    data[name] = [data_elem.text]
+            if (tag := child.tag) == "data":
+                if (name := child.get("name")) is not None:
+                    data.setdefault(name, []).append(text)
+            elif tag == "summary":
+                if summary is None:
+                    summary = StrElementField(text)
+            elif tag == "details":
+                if details is None:
+                    details = StrElementField(text)
 
         return Status(
             code=xml_element.attrib["code"], summary=summary, details=details, data=data
@@ -13,11 +13,11 @@ non-administrators.
 
 from dataclasses import dataclass
 from enum import StrEnum, auto, unique
-from typing import ClassVar, Literal, overload
+from typing import Literal, overload
 from py_obs.osc import Osc
 from py_obs.status import Status
 
-from py_obs.xml_factory import MetaMixin
+from py_obs.xml_factory import MetaMixin, iter_child_elements
 
 
 @unique
@@ -71,27 +71,13 @@ class Token(MetaMixin):
     description: str = ""
 
 
-@dataclass(frozen=True)
-class _TokenDirectory(MetaMixin):
-    _element_name: ClassVar[str] = "directory"
-
-    #: number of tokens
-    count: int
-
-    #: tokens of the user
-    entry: list[Token]
-
-
 async def fetch_user_tokens(osc: Osc, username: str | None = None) -> list[Token]:
     """Fetch all tokens belonging to the user with the provided username. If no
     username is supplied, then the username of ``osc`` is used.
 
     """
-    return (
-        await _TokenDirectory.from_response(
-            await osc.api_request(f"/person/{username or osc.username}/token")
-        )
-    ).entry
+    res = await osc.api_request(f"/person/{username or osc.username}/token")
+    return [token async for token in Token.from_response_stream(res, "directory")]
 
 
 @overload
@@ -235,10 +221,17 @@ async def create_token(
             " with name='id'"
         )
 
-    id = int(ids[0])
-    tokens = await fetch_user_tokens(osc, username)
-    for token in tokens:
-        if token.id == id:
-            return token
-
-    raise RuntimeError("OBS did not return the newly created token")
+    # only decode the new token, the entries of all other tokens are skipped
+    # based on their id attribute
+    id = str(int(ids[0]))
+    new_token: Token | None = None
+    async for entry in iter_child_elements(
+        await osc.api_request(f"/person/{username or osc.username}/token"),
+        "directory",
+    ):
+        if new_token is None and entry.get("id") == id:
+            new_token = Token.from_xml(entry)
+
+    if new_token is None:
+        raise RuntimeError("OBS did not return the newly created token")
+    return new_token
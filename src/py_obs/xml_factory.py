@@ -1,6 +1,7 @@
 from abc import ABC
 import dataclasses
 import enum
+import functools
 import types
 import typing
 import xml.etree.ElementTree as ET
@@ -12,18 +13,168 @@ if typing.TYPE_CHECKING:
 else:
     DataclassInstance = None
 
+try:
+    from lxml import etree as _lxml_etree  # type: ignore[import-untyped,import-not-found]
+except ImportError:
+    _lxml_etree = None
+
+
+#: options of all lxml parsers: comments and processing instructions are
+#: dropped to behave like the stdlib parser
+_LXML_PARSER_OPTIONS: dict[str, typing.Any] = {
+    "resolve_entities": False,
+    "remove_comments": True,
+    "remove_pis": True,
+}
+
+#: lxml parser used for parsing complete documents if lxml is installed
+_LXML_PARSER = (
+    _lxml_etree.XMLParser(**_LXML_PARSER_OPTIONS) if _lxml_etree is not None else None
+)
+
+
+def parse_xml(xml: str | bytes) -> ET.Element:
+    """Parse the supplied XML document and return its root element.
+
+    The document is parsed with lxml if it is available and with
+    :py:mod:`xml.etree.ElementTree` otherwise. The returned element supports
+    the :py:class:`~xml.etree.ElementTree.Element` API in both cases.
+
+    """
+    if _LXML_PARSER is None:
+        return ET.fromstring(xml)
+
+    # lxml refuses to parse unicode strings with an encoding declaration
+    return typing.cast(
+        ET.Element,
+        _lxml_etree.fromstring(
+            xml.encode() if isinstance(xml, str) else xml, _LXML_PARSER
+        ),
+    )
+
+
+def serialize_xml(elem: ET.Element) -> bytes:
+    """Serialize the supplied element into an UTF-8 encoded XML document
+    without a XML declaration.
+
+    Elements created by lxml (e.g. via :py:func:`parse_xml`) are serialized by
+    lxml, all others by :py:mod:`xml.etree.ElementTree`.
+
+    """
+    if _lxml_etree is not None and _lxml_etree.iselement(elem):
+        return typing.cast(bytes, _lxml_etree.tostring(elem, encoding="utf-8"))
+
+    # the default us-ascii encoding escapes all non-ascii characters in an
+    # extra pass, encoding the serialized string ourselves is cheaper
+    return ET.tostring(elem, encoding="unicode").encode()
+
+
+#: size of the chunks in which response bodies are fed into the pull parser
+_CHUNK_SIZE = 64 * 1024
+
+
+def _feed_parser() -> ET.XMLParser:
+    # a new parser is required per document, as documents are fed
+    # concurrently by different coroutines
+    if _lxml_etree is None:
+        return ET.XMLParser()
+    return typing.cast(ET.XMLParser, _lxml_etree.XMLParser(**_LXML_PARSER_OPTIONS))
+
+
+def _pull_parser() -> ET.XMLPullParser:
+    if _lxml_etree is None:
+        return ET.XMLPullParser(events=("start", "end"))
+    return typing.cast(
+        ET.XMLPullParser,
+        _lxml_etree.XMLPullParser(events=("start", "end"), **_LXML_PARSER_OPTIONS),
+    )
+
+
+async def parse_response(resp: ClientResponse) -> ET.Element:
+    """Parse the body of the response and return its root element.
+
+    The body is fed into the parser while it is received, so that the raw
+    response is never kept in memory in addition to the parsed tree.
+
+    """
+    parser = _feed_parser()
+    async for chunk in resp.content.iter_chunked(_CHUNK_SIZE):
+        parser.feed(chunk)
+    return parser.close()
+
+
+async def iter_child_elements(
+    resp: ClientResponse, root_name: str
+) -> typing.AsyncIterator[ET.Element]:
+    """Parse the body of the response incrementally and yield every direct
+    child of the root element as soon as it has been received completely.
+
+    Children are removed from the tree once they have been processed, so that
+    neither the raw response nor the whole tree has to be kept in memory.
+
+    """
+    parser = _pull_parser()
+    root: ET.Element | None = None
+    depth = 0
+
+    def _completed_children() -> typing.Iterator[ET.Element]:
+        nonlocal root, depth
+        for event, elem in parser.read_events():
+            if event == "start":
+                if root is None:
+                    if elem.tag != root_name:
+                        raise ValueError(
+                            f"Invalid XML tag '{elem.tag}', expected '{root_name}'"
+                        )
+                    root = elem
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth == 1:
+                assert root is not None
+                yield elem
+                root.remove(elem)
+
+    async for chunk in resp.content.iter_chunked(_CHUNK_SIZE):
+        parser.feed(chunk)
+        for child in _completed_children():
+            yield child
+
+    parser.close()
+    for child in _completed_children():
+        yield child
+
 
 StrElementField = typing.NewType("StrElementField", str)
 
+_Converter = typing.Callable[[ET.Element], typing.Any]
+
+#: cache of the decoders of each field of the MetaMixin subclasses, see
+#: :py:meth:`MetaMixin._field_decoders`
+_FIELD_DECODERS: dict[type, list[tuple[str, _Converter]]] = {}
+
+#: cache of the public fields of the MetaMixin subclasses, see
+#: :py:meth:`MetaMixin._public_fields`
+_PUBLIC_FIELDS: dict[type, list[dataclasses.Field[typing.Any]]] = {}
+
 
 T = typing.TypeVar("T")
 
 
 class MetaMixin(ABC):
+    # no instance attributes, so that dataclasses with slots=True do not get a
+    # __dict__
+    __slots__ = ()
+
     _element_name: typing.ClassVar[str] = ""
     _field_converters: typing.ClassVar[
         dict[str, typing.Callable[[ET.Element], typing.Any]] | None
     ] = None
+    _field_transformers: typing.ClassVar[
+        dict[str, typing.Callable[[typing.Any], tuple[typing.Any, str, typing.Any]]]
+        | None
+    ] = None
 
     M = typing.TypeVar("M", bound="MetaMixin")
 
@@ -68,6 +219,11 @@ class MetaMixin(ABC):
         """Override this method if you wish for certain fields to use a
         different value or type or xml tag.
 
+        For single fields, it is sufficient to add a function to the class'
+        ``_field_transformers`` dictionary under the field's name, which
+        receives the instance and returns the same tuple. Entries in this
+        dictionary take precedence over this method.
+
         Args:
             field: A field (obtained via :py:func:`dataclasses.fields()`)
                 belonging to this class.
@@ -83,23 +239,21 @@ class MetaMixin(ABC):
     @property
     def meta(self) -> ET.Element:
         elem = ET.Element(self._element_name)
-        for field in dataclasses.fields(typing.cast(DataclassInstance, self)):
-            # omit private fields
-            if field.name.startswith("_"):
-                continue
-
+        transformers = self._field_transformers
+        for field in self._public_fields():
             val: typing.Any
             type: typing.Any
-            val, name, type = self.field_transformer(field)
+            if transformers is not None and (transform := transformers.get(field.name)):
+                val, name, type = transform(self)
+            else:
+                val, name, type = self.field_transformer(field)
+            is_str_element, is_optional, must_not_be_none = MetaMixin._type_info(type)
 
             if isinstance(val, list):
                 for entry in MetaMixin._list_to_xml(name, val):
                     elem.append(entry)
-            elif (
-                StrElementField in (args := typing.get_args(type))
-                or type is StrElementField
-            ):
-                if self._is_union_type(type) and types.NoneType in args and val is None:
+            elif is_str_element:
+                if is_optional and val is None:
                     continue
                 (field_as_subelement := ET.Element(name)).text = str(val)
                 elem.append(field_as_subelement)
@@ -111,115 +265,209 @@ class MetaMixin(ABC):
                 if val:
                     elem.attrib[name] = str(val)
 
-            if (
-                MetaMixin._is_union_type(type)
-                and types.NoneType not in typing.get_args(type)
-                and val is None
-            ):
+            if must_not_be_none and val is None:
                 raise ValueError(f"field '{field.name}' is None, but it must not be")
 
         return elem
 
+    @classmethod
+    def _public_fields(cls) -> list[dataclasses.Field[typing.Any]]:
+        if (fields := _PUBLIC_FIELDS.get(cls)) is None:
+            fields = _PUBLIC_FIELDS[cls] = [
+                field
+                for field in dataclasses.fields(
+                    typing.cast(typing.Type[DataclassInstance], cls)
+                )
+                # omit private fields
+                if not field.name.startswith("_")
+            ]
+        return fields
+
+    @staticmethod
+    @functools.cache
+    def _type_info(type: typing.Any) -> tuple[bool, bool, bool]:
+        """Returns whether a field of the type ``type`` is serialized as a
+        subelement, whether it is optional and whether it is a union that does
+        not permit ``None``.
+
+        """
+        args = typing.get_args(type)
+        is_union = MetaMixin._is_union_type(type)
+        return (
+            StrElementField in args or type is StrElementField,
+            is_union and types.NoneType in args,
+            is_union and types.NoneType not in args,
+        )
+
     @staticmethod
     def _get_value_from_xml(
         name: str, xml_element: ET.Element, type: typing.Any
     ) -> typing.Any:
+        return MetaMixin._converter(name, type)(xml_element)
+
+    @staticmethod
+    @functools.cache
+    def _converter(name: str, type: typing.Any) -> _Converter:
+        """Create a function that extracts the value of the field ``name`` with
+        the type ``type`` from a xml element.
+
+        The dispatch on the type only happens once per name and type, the
+        returned function only performs the actual lookups in the element.
+
+        """
         if hasattr(type, "from_xml"):
-            matching_children = xml_element.findall(type._element_name)
-            if len(matching_children) != 1:
-                raise ValueError(
-                    "Expected to find one element with the tag "
-                    f"{type._element_name}, but got {len(matching_children)}"
-                )
-            return type.from_xml(matching_children[0])
+            child_name = type._element_name
+
+            def _from_child(xml_element: ET.Element) -> typing.Any:
+                matching_children = xml_element.findall(child_name)
+                if len(matching_children) != 1:
+                    raise ValueError(
+                        "Expected to find one element with the tag "
+                        f"{child_name}, but got {len(matching_children)}"
+                    )
+                return type.from_xml(matching_children[0])
+
+            return _from_child
 
         if type is str:
-            return xml_element.attrib[name]
+            return lambda xml_element: xml_element.attrib[name]
         if type is StrElementField:
-            matching_children = xml_element.findall(name)
-            if len(matching_children) != 1:
-                raise ValueError(
-                    f"Expected exactly 1 child element with the name {name},"
-                    f" but got {len(matching_children)}"
-                )
-            # empty xml elements will contain None as text, but we must return a
-            # string
-            return matching_children[0].text or ""
+
+            def _from_subelement(xml_element: ET.Element) -> str:
+                matching_children = xml_element.findall(name)
+                if len(matching_children) != 1:
+                    raise ValueError(
+                        f"Expected exactly 1 child element with the name {name},"
+                        f" but got {len(matching_children)}"
+                    )
+                # empty xml elements will contain None as text, but we must
+                # return a string
+                return matching_children[0].text or ""
+
+            return _from_subelement
 
         try:
             if issubclass(type, enum.Enum):
-                return type(xml_element.attrib[name])
+                members = {member.value: member for member in type}
+
+                def _enum_from_attrib(xml_element: ET.Element) -> enum.Enum:
+                    val = xml_element.attrib[name]
+                    if (member := members.get(val)) is None:
+                        # let the enum raise the appropriate error
+                        return type(val)
+                    return member
+
+                return _enum_from_attrib
         except TypeError:
             # type is not a class
             pass
 
         if type is int:
-            return int(xml_element.attrib[name])
+            return lambda xml_element: int(xml_element.attrib[name])
         if type is bool:
-            if (val := xml_element.attrib[name]) not in ("true", "false"):
-                raise ValueError(f"Invalid boolean value '{val}'")
-            return val == "true"
+
+            def _bool_from_attrib(xml_element: ET.Element) -> bool:
+                if (val := xml_element.attrib[name]) not in ("true", "false"):
+                    raise ValueError(f"Invalid boolean value '{val}'")
+                return val == "true"
+
+            return _bool_from_attrib
+
         if typing.get_origin(type) is list:
             assert len(list_types := typing.get_args(type)) == 1
-            if hasattr(list_types[0], "from_xml"):
-                return [
-                    list_types[0].from_xml(elem) for elem in xml_element.findall(name)
+            entry_type = list_types[0]
+            if hasattr(entry_type, "from_xml"):
+                return lambda xml_element: [
+                    entry_type.from_xml(elem) for elem in xml_element.findall(name)
                 ]
-            else:
-                return [list_types[0](elem.text) for elem in xml_element.findall(name)]
+            return lambda xml_element: [
+                entry_type(elem.text) for elem in xml_element.findall(name)
+            ]
 
         if MetaMixin._is_union_type(type):
-            # try all possible types in a Union and store them for later
-            results = []
-            for possible_type in typing.get_args(type):
-                try:
-                    results.append(
-                        MetaMixin._get_value_from_xml(name, xml_element, possible_type)
-                    )
-                except (ValueError, KeyError):
-                    pass
+            possible_types = typing.get_args(type)
+            converters = [MetaMixin._converter(name, tp) for tp in possible_types]
+            is_optional = types.NoneType in possible_types
+            list_in_types = any(typing.get_origin(tp) for tp in possible_types)
+
+            def _from_union(xml_element: ET.Element) -> typing.Any:
+                # try all possible types in a Union and store them for later
+                results = []
+                for converter in converters:
+                    try:
+                        results.append(converter(xml_element))
+                    except (ValueError, KeyError):
+                        pass
+
+                # special handling for optional lists:
+                # a list converter returns an empty list for optional lists,
+                # but then we actually want to return None and not []
+                if is_optional and (
+                    not results
+                    or (list_in_types and results and all(not res for res in results))
+                ):
+                    return None
+
+                return results[0]
+
+            return _from_union
+
+        def _unknown_type(_xml_element: ET.Element) -> typing.Any:
+            raise ValueError(f"Unknown type {type}")
+
+        return _unknown_type
 
-            # special handling for optional lists:
-            # _get_value_from_xml will return an empty list for optional lists,
-            # but then we actually want to return None and not []
-            list_in_types = any(typing.get_origin(tp) for tp in typing.get_args(type))
-            if types.NoneType in typing.get_args(type) and (
-                not results
-                or (list_in_types and results and all(not res for res in results))
-            ):
-                return None
+    @classmethod
+    def _field_decoders(cls) -> list[tuple[str, _Converter]]:
+        """Returns the name and the function to obtain the value from a xml
+        element for every public field of this class.
 
-            return results[0]
+        """
+        if (decoders := _FIELD_DECODERS.get(cls)) is not None:
+            return decoders
 
-        raise ValueError(f"Unknown type {type}")
+        decoders = []
+        for field in cls._public_fields():
+            if cls._field_converters and field.name in cls._field_converters:
+                decoders.append((field.name, cls._field_converters[field.name]))
+            else:
+                field_type: typing.Any = field.type
+                decoders.append(
+                    (field.name, MetaMixin._converter(field.name, field_type))
+                )
+
+        _FIELD_DECODERS[cls] = decoders
+        return decoders
 
     @classmethod
     async def from_response(cls: typing.Type[M], resp: ClientResponse) -> M:
-        return cls.from_xml(await resp.read())
+        return cls.from_xml(await parse_response(resp))
+
+    @classmethod
+    async def from_response_stream(
+        cls: typing.Type[M], resp: ClientResponse, root_name: str
+    ) -> typing.AsyncIterator[M]:
+        """Parse the response incrementally and yield an instance of this class
+        for every matching child of the root element ``root_name`` as soon as
+        it has been received.
+
+        This avoids keeping the whole response or tree in memory for large
+        collections, e.g. build results or directory listings.
+
+        """
+        async for elem in iter_child_elements(resp, root_name):
+            if elem.tag == cls._element_name:
+                yield cls.from_xml(elem)
 
     @classmethod
     def from_xml(cls: typing.Type[M], xml: ET.Element | str | bytes) -> M:
-        xml_element = ET.fromstring(xml) if isinstance(xml, (str, bytes)) else xml
+        xml_element = parse_xml(xml) if isinstance(xml, (str, bytes)) else xml
 
         if xml_element.tag != cls._element_name:
             raise ValueError(
                 f"Invalid XML tag '{xml_element.tag}', expected '{cls._element_name}'"
             )
 
-        kwargs: dict[str, typing.Any] = {}
-
-        for field in dataclasses.fields(
-            typing.cast(typing.Type[DataclassInstance], cls)
-        ):
-            # omit private fields
-            if field.name.startswith("_"):
-                continue
-
-            if cls._field_converters and field.name in cls._field_converters:
-                val = cls._field_converters[field.name](xml_element)
-            else:
-                val = MetaMixin._get_value_from_xml(field.name, xml_element, field.type)
-
-            kwargs[field.name] = val
-
-        return cls(**kwargs)
+        return cls(
+            **{name: decode(xml_element) for name, decode in cls._field_decoders()}
+        )
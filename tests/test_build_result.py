@@ -0,0 +1,159 @@
+import pytest
+
+from py_obs.build_result import (
+    BuildResult,
+    BuildResultList,
+    PackageCode,
+    PackageStatus,
+    RepositoryCode,
+    fetch_build_results_many,
+)
+
+
+RESULT_LIST = b"""<?xml version="1.0" encoding="UTF-8"?>
+<resultlist state="c181538ad4b4f5d4d6f2ac3ee6d4ad4e">
+  <result project="openSUSE:Factory" repository="standard" arch="x86_64" code="published" state="published">
+    <status package="nginx" code="succeeded"/>
+  </result>
+  <result project="openSUSE:Factory" repository="standard" arch="i586" code="building" state="building" dirty="true">
+    <status package="nginx" code="failed">
+      <details>failed to fetch sources</details>
+    </status>
+    <status package="nginx:flavor" code="scheduled"/>
+  </result>
+</resultlist>
+"""
+
+
+class _ChunkedContent:
+    def __init__(self, data: bytes, chunk_size: int) -> None:
+        self._data = data
+        self._chunk_size = chunk_size
+
+    async def iter_chunked(self, _n: int):
+        for i in range(0, len(self._data), self._chunk_size):
+            yield self._data[i : i + self._chunk_size]
+
+
+class _FakeResponse:
+    def __init__(self, data: bytes, chunk_size: int) -> None:
+        self.content = _ChunkedContent(data, chunk_size)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+async def test_iter_from_stream(chunk_size: int) -> None:
+    results = [
+        res
+        async for res in BuildResultList.iter_from_stream(
+            _FakeResponse(RESULT_LIST, chunk_size)  # type: ignore[arg-type]
+        )
+    ]
+
+    assert results == BuildResultList.from_xml(RESULT_LIST).result
+    assert results == [
+        BuildResult(
+            project="openSUSE:Factory",
+            repository="standard",
+            arch="x86_64",
+            state=RepositoryCode.PUBLISHED,
+            code=RepositoryCode.PUBLISHED,
+            dirty=None,
+            status=[
+                PackageStatus(package="nginx", code=PackageCode.SUCCEEDED, details=[])
+            ],
+        ),
+        BuildResult(
+            project="openSUSE:Factory",
+            repository="standard",
+            arch="i586",
+            state=RepositoryCode.BUILDING,
+            code=RepositoryCode.BUILDING,
+            dirty=True,
+            status=[
+                PackageStatus(
+                    package="nginx",
+                    code=PackageCode.FAILED,
+                    details=["failed to fetch sources"],
+                ),
+                PackageStatus(
+                    package="nginx:flavor", code=PackageCode.SCHEDULED, details=[]
+                ),
+            ],
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_from_stream_rejects_wrong_root() -> None:
+    with pytest.raises(ValueError, match="expected 'resultlist'"):
+        async for _ in BuildResultList.iter_from_stream(
+            _FakeResponse(b"<status code='ok'/>", 4096)  # type: ignore[arg-type]
+        ):
+            pass
+
+
+def test_unknown_codes_are_mapped_to_unknown() -> None:
+    res = BuildResult.from_xml(
+        """<result project="foo" repository="standard" arch="riscv64" code="frobnicating" state="published">
+  <status package="bar" code="compiling"/>
+</result>"""
+    )
+
+    assert res.code == RepositoryCode.UNKNOWN
+    assert res.state == RepositoryCode.PUBLISHED
+    assert res.status == [
+        PackageStatus(package="bar", code=PackageCode.UNKNOWN, details=[])
+    ]
+
+
+class _FakeOsc:
+    """Answers every build result request with a result list that only contains
+    the requested package.
+
+    """
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, dict[str, str]]] = []
+
+    async def api_request(self, route: str, params: dict[str, str]) -> _FakeResponse:
+        self.requests.append((route, params))
+        pkg = params["package"]
+        return _FakeResponse(
+            f"""<resultlist state="abc">
+  <result project="foo" repository="standard" arch="x86_64" code="published" state="published">
+    <status package="{pkg}" code="succeeded"/>
+  </result>
+  <result project="foo" repository="standard" arch="aarch64" code="published" state="published">
+    <status package="{pkg}" code="failed"/>
+  </result>
+</resultlist>""".encode(),
+            16,
+        )
+
+
+@pytest.mark.asyncio
+async def test_fetch_build_results_many() -> None:
+    osc = _FakeOsc()
+    results = await fetch_build_results_many(
+        osc, "foo", ["vim", "emacs"]  # type: ignore[arg-type]
+    )
+
+    assert sorted(osc.requests, key=lambda req: req[1]["package"]) == [
+        (
+            "/build/foo/_result",
+            {"view": "status", "multibuild": "1", "locallink": "1", "package": pkg},
+        )
+        for pkg in ("emacs", "vim")
+    ]
+
+    # one entry per package in the supplied order, each only containing the
+    # results of its own package
+    assert list(results) == ["vim", "emacs"]
+    for pkg, pkg_results in results.items():
+        assert [(res.arch, res.status) for res in pkg_results] == [
+            ("x86_64", [PackageStatus(pkg, PackageCode.SUCCEEDED, details=[])]),
+            ("aarch64", [PackageStatus(pkg, PackageCode.FAILED, details=[])]),
+        ]
+
+    assert await fetch_build_results_many(osc, "foo", []) == {}  # type: ignore[arg-type]
@@ -1,6 +1,11 @@
 import asyncio
 import pytest
-from py_obs.project import fetch_all_files, fetch_file_contents, upload_file_contents
+from py_obs.project import (
+    fetch_all_files,
+    fetch_file_contents,
+    fetch_file_contents_to,
+    upload_file_contents,
+)
 
 from tests.conftest import HOME_PROJ_T
 
@@ -17,6 +22,23 @@ async def test_upload_file(home_project: HOME_PROJ_T):
         assert (await fetch_file_contents(osc_, prj, pkg, fname)).decode() == CONTENTS
 
 
+@pytest.mark.asyncio
+async def test_fetch_file_contents_to(home_project: HOME_PROJ_T):
+    contents = b"foobar" * 100_000
+    fname = "testfile"
+
+    osc, _, prj, pkg = home_project
+    await upload_file_contents(osc, prj, pkg, fname, contents)
+
+    received = bytearray()
+
+    async def _write(chunk: bytes) -> None:
+        received.extend(chunk)
+
+    await fetch_file_contents_to(osc, prj, pkg, fname, _write)
+    assert received == contents
+
+
 @pytest.mark.asyncio
 async def test_fetch_all_files(home_project: HOME_PROJ_T):
     basename = "foo"
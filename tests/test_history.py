@@ -3,7 +3,12 @@ import re
 import pytest
 
 from py_obs.history import fetch_package_history
-from py_obs.project import delete, fetch_package_diff, upload_file_contents
+from py_obs.project import (
+    delete,
+    fetch_package_diff,
+    fetch_package_diffs,
+    upload_file_contents,
+)
 
 from tests.conftest import HOME_PROJ_T
 
@@ -82,3 +87,8 @@ async def test_diff(home_project: HOME_PROJ_T) -> None:
 
     assert first_diff == await fetch_package_diff(osc, prj, pkg, revision=1)
     assert second_diff == await fetch_package_diff(osc, prj, pkg, revision=2)
+
+    assert await fetch_package_diffs(osc, prj, pkg, [2, 1]) == [
+        second_diff,
+        first_diff,
+    ]
@@ -1,13 +1,32 @@
 import asyncio
+import gc
+import http.cookiejar
+from http.cookies import SimpleCookie
 from datetime import datetime, timedelta
 from pathlib import Path
 import os.path
+import shutil
+import subprocess
+import textwrap
+import weakref
 
 from aiohttp import ClientResponse
 import aiohttp
 import pytest
-
-from py_obs.osc import BackOff, Osc
+from yarl import URL
+
+from py_obs.osc import (
+    BackOff,
+    BackpressureController,
+    CookieJar,
+    Osc,
+    _extract_ssh_signature,
+    _flush_cookie_jars,
+    _parse_auth_challenge,
+    _server_retry_delay,
+    _load_ssh_private_key,
+    _sshsig_sign,
+)
 from tests.conftest import LOCAL_OSC_T
 
 
@@ -66,6 +85,20 @@ sshkey = id_ed22519
             "https://api.bar.foo",
             "https://api.bar.foo",
         ),
+        (
+            """[general]
+apiurl = https://api.foo.bar
+
+[https://api.foo.bar]
+user = me
+pass = 100%(secret)s
+""",
+            "me",
+            "100%(secret)s",
+            None,
+            "https://api.foo.bar",
+            None,
+        ),
     ],
 )
 def test_read_from_oscrc(
@@ -146,18 +179,222 @@ async def test_backoff() -> None:
     exponentially increasing times.
 
     """
-    before = datetime.now()
-    resp = await Osc("foo", password="irrelevant").api_request(
-        "/test", backoff=BackOff(initial_sleep_time=0.5, increase_factor=1.0)
+    async with Osc("foo", password="irrelevant") as osc:
+        before = datetime.now()
+        resp = await osc.api_request(
+            "/test",
+            backoff=BackOff(initial_sleep_time=0.5, increase_factor=1.0, jitter=False),
+        )
+        after = datetime.now()
+
+        # we have 4 errors, i.e. we wait for at least (4 * 0.5)s = 2.0s
+        assert after - before >= timedelta(seconds=2)
+
+        # final message is a 200
+        assert resp.status == 200
+        assert (await resp.text()) == "Success"
+
+
+@pytest.mark.vcr
+@pytest.mark.asyncio
+async def test_retry_after_is_capped() -> None:
+    """A Retry-After of one hour must not make us wait for longer than
+    BackOff.max_sleep_time.
+
+    """
+    async with Osc("foo", password="irrelevant") as osc:
+        resp = await asyncio.wait_for(
+            osc.api_request("/test", backoff=BackOff(max_sleep_time=0.1)), timeout=5
+        )
+        assert resp.status == 200
+        assert (await resp.text()) == "Success"
+
+
+@pytest.mark.vcr
+@pytest.mark.asyncio
+async def test_retry_sleep_frees_the_slot() -> None:
+    """A request that waits before its next retry must not block the other
+    requests of the instance.
+
+    """
+    async with Osc("foo", password="irrelevant", max_concurrent=1) as osc:
+        slow = asyncio.create_task(osc.api_request("/slow"))
+        await asyncio.sleep(0.1)
+
+        # the slow request now sleeps for one second due to its Retry-After
+        fast = await asyncio.wait_for(osc.api_request("/fast"), timeout=0.5)
+        assert (await fast.text()) == "Success"
+        assert not slow.done()
+
+        assert (await (await slow).text()) == "Success"
+
+
+@pytest.mark.asyncio
+async def test_backpressure_controller() -> None:
+    ctrl = BackpressureController(max_concurrency=4)
+    assert ctrl.concurrency == 4
+
+    ctrl.on_error()
+    assert ctrl.concurrency == 2
+    ctrl.on_error()
+    ctrl.on_error()
+    assert ctrl.concurrency == 1
+
+    ctrl.on_success()
+    ctrl.on_success()
+    assert ctrl.concurrency == 2
+    ctrl.on_error()
+    assert ctrl.concurrency == 1
+
+    in_flight = max_in_flight = 0
+
+    async def request() -> None:
+        nonlocal in_flight, max_in_flight
+        async with ctrl:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(request() for _ in range(5)))
+    assert max_in_flight == 1
+
+
+def test_shared_connector_releases_closed_loops(tmp_path: Path) -> None:
+    loops: list[weakref.ref[asyncio.AbstractEventLoop]] = []
+
+    async def use_osc() -> None:
+        loops.append(weakref.ref(asyncio.get_running_loop()))
+        async with Osc(
+            "foo", password="irrelevant", cookie_jar_path=str(tmp_path / "jar")
+        ) as osc:
+            osc._get_session()
+
+    for _ in range(4):
+        asyncio.run(use_osc())
+
+    gc.collect()
+    # the connector of the last loop is only evicted on the next use
+    assert [loop() for loop in loops[:-1]] == [None] * 3
+
+
+@pytest.mark.parametrize(
+    "headers,delay",
+    [
+        ({}, None),
+        ({"Retry-After": "3"}, 3.0),
+        ({"Retry-After": "-1"}, 0.0),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+        ({"Retry-After": "soon"}, None),
+        ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "7"}, 7.0),
+        ({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "7"}, None),
+    ],
+)
+def test_server_retry_delay(headers: dict[str, str], delay: float | None) -> None:
+    assert _server_retry_delay(headers) == delay
+
+
+def test_cookie_jar_filter_cookies(tmp_path: Path) -> None:
+    jar = CookieJar(str(tmp_path / "cookiejar"))
+    for name, domain in (
+        ("exact", "api.opensuse.org"),
+        ("parent", ".opensuse.org"),
+        ("tld", ".org"),
+        ("sibling", "build.opensuse.org"),
+        ("subdomain", ".api.opensuse.org"),
+        ("no_label_boundary", ".pensuse.org"),
+    ):
+        jar.set_cookie(
+            http.cookiejar.Cookie(
+                version=0,
+                name=name,
+                value="val",
+                port=None,
+                port_specified=False,
+                domain=domain,
+                domain_specified=True,
+                domain_initial_dot=domain.startswith("."),
+                path="/",
+                path_specified=True,
+                secure=False,
+                expires=None,
+                discard=False,
+                comment=None,
+                comment_url=None,
+                rest={},
+            )
+        )
+
+    url = URL("https://api.opensuse.org/about")
+    assert sorted(jar.filter_cookies(url)) == [
+        ("exact", "val"),
+        ("parent", "val"),
+        ("tld", "val"),
+    ]
+
+    # modifications of the jar must not be hidden by the cached result
+    jar.clear(domain=".org")
+    assert sorted(jar.filter_cookies(url)) == [("exact", "val"), ("parent", "val")]
+
+
+def test_cookie_jar_starts_empty_if_path_is_a_directory(tmp_path: Path) -> None:
+    (jar_dir := tmp_path / "cookiejar").mkdir()
+    assert not list(CookieJar(str(jar_dir)))
+
+
+def test_cookie_jar_starts_empty_if_unreadable(tmp_path: Path) -> None:
+    (jar_file := tmp_path / "unreadable").write_text(
+        "#LWP-Cookies-2.0\nSet-Cookie3: session=abc; domain=example.org\n"
+    )
+    jar_file.chmod(0)
+    if os.access(jar_file, os.R_OK):
+        pytest.skip("the file is readable anyway (running as root?)")
+    assert not list(CookieJar(str(jar_file)))
+
+
+def test_cookie_jar_update_cookies(tmp_path: Path) -> None:
+    jar = CookieJar(str(tmp_path / "cookiejar"))
+    cookies: SimpleCookie = SimpleCookie()
+    cookies.load(
+        "session=abc; Path=/; Domain=.opensuse.org; "
+        "Expires=Wed, 21 Oct 2099 07:28:00 GMT"
     )
-    after = datetime.now()
+    cookies.load("host_only=def; Path=/")
+    jar.update_cookies(cookies, URL("https://api.opensuse.org/about"))
 
-    # we have 4 errors, i.e. we wait for at least (4 * 0.5)s = 2.0s
-    assert after - before >= timedelta(seconds=2)
+    assert sorted(jar.filter_cookies(URL("https://api.opensuse.org/"))) == [
+        ("host_only", "def"),
+        ("session", "abc"),
+    ]
+    assert jar.filter_cookies(URL("https://build.opensuse.org/")) == [
+        ("session", "abc")
+    ]
+    assert jar._cookies[".opensuse.org"]["/"]["session"].expires == 4096250880
 
-    # final message is a 200
-    assert resp.status == 200
-    assert (await resp.text()) == "Success"
+
+def test_cookie_jar_is_flushed_on_exit(tmp_path: Path) -> None:
+    jar_path = tmp_path / "cookiejar"
+    cookies: SimpleCookie = SimpleCookie()
+    cookies.load("session=abc; Path=/")
+
+    async def update(jar: CookieJar) -> None:
+        # schedules a save that never runs, as the loop is closed right away
+        jar.update_cookies(cookies, URL("https://api.opensuse.org/about"))
+
+    # the jar is dropped without being flushed, e.g. by an Osc instance that
+    # was never closed
+    asyncio.run(update(jar := CookieJar(str(jar_path))))
+    jar_ref = weakref.ref(jar)
+    del jar
+    gc.collect()
+    assert not jar_path.exists()
+
+    _flush_cookie_jars()
+    assert "session=abc" in jar_path.read_text()
+
+    # saved => no longer referenced
+    gc.collect()
+    assert jar_ref() is None
 
 
 @pytest.mark.asyncio
@@ -204,3 +441,116 @@ async def test_timeout_no_recovery(
 
     assert "Sending a GET request to /about timed out" in str(runtime_err_ctx.value)
     assert calls == 2
+
+
+@pytest.mark.skipif(not shutil.which("ssh-keygen"), reason="ssh-keygen is required")
+@pytest.mark.parametrize("key_type", ["ed25519", "rsa", "ecdsa"])
+def test_sshsig_matches_ssh_keygen(tmp_path: Path, key_type: str) -> None:
+    pytest.importorskip("cryptography")
+
+    key = tmp_path / "id_key"
+    subprocess.check_call(
+        ["ssh-keygen", "-q", "-t", key_type, "-N", "", "-C", "me", "-f", str(key)]
+    )
+    private_key = _load_ssh_private_key(f"{key}.pub")
+    assert private_key is not None
+
+    data = b"(created): 1700000000"
+    sig = _sshsig_sign(private_key, "obs-realm", data)
+
+    (sig_file := tmp_path / "sig").write_text(
+        "-----BEGIN SSH SIGNATURE-----\n"
+        + "\n".join(textwrap.wrap(sig, 70))
+        + "\n-----END SSH SIGNATURE-----\n"
+    )
+    (allowed := tmp_path / "allowed_signers").write_text(
+        "me " + (tmp_path / "id_key.pub").read_text()
+    )
+    subprocess.run(
+        [
+            "ssh-keygen",
+            "-Y",
+            "verify",
+            "-f",
+            str(allowed),
+            "-I",
+            "me",
+            "-n",
+            "obs-realm",
+            "-s",
+            str(sig_file),
+        ],
+        input=data,
+        check=True,
+    )
+
+
+@pytest.mark.skipif(not shutil.which("ssh-keygen"), reason="ssh-keygen is required")
+def test_passphrase_protected_key_is_not_loaded(tmp_path: Path) -> None:
+    pytest.importorskip("cryptography")
+
+    key = tmp_path / "id_ed25519"
+    subprocess.check_call(
+        ["ssh-keygen", "-q", "-t", "ed25519", "-N", "secret", "-f", str(key)]
+    )
+
+    assert _load_ssh_private_key(f"{key}.pub") is None
+    assert _load_ssh_private_key(str(tmp_path / "missing.pub")) is None
+
+
+@pytest.mark.parametrize(
+    "armored,sig",
+    [
+        (
+            """-----BEGIN SSH SIGNATURE-----
+U1NIU0lHAAAAAQAAADMAAAALc3NoLWVkMjU1MTkAAAAg
+AAAABnNoYTUxMg==
+-----END SSH SIGNATURE-----
+""",
+            "U1NIU0lHAAAAAQAAADMAAAALc3NoLWVkMjU1MTkAAAAgAAAABnNoYTUxMg==",
+        ),
+        ("-----BEGIN SSH SIGNATURE-----\nAAAA\n-----END SSH SIGNATURE-----", "AAAA"),
+        (
+            "garbage\n-----BEGIN SSH SIGNATURE-----\nAAAA\n-----END SSH SIGNATURE-----",
+            None,
+        ),
+        ("-----BEGIN SSH SIGNATURE-----\nAAAA\n", None),
+        ("-----BEGIN SSH SIGNATURE-----\n\n-----END SSH SIGNATURE-----", None),
+    ],
+)
+def test_extract_ssh_signature(armored: str, sig: str | None) -> None:
+    if sig is None:
+        with pytest.raises(RuntimeError, match="Could not extract SSH signature"):
+            _extract_ssh_signature(armored)
+    else:
+        assert _extract_ssh_signature(armored) == sig
+
+
+@pytest.mark.parametrize(
+    "challenge,scheme,params",
+    [
+        (
+            'Basic realm="Use your SUSE developer account"',
+            "basic",
+            {"realm": "Use your SUSE developer account"},
+        ),
+        (
+            'Signature realm="Use your developer account, or your SSH key",headers="(created)"',
+            "signature",
+            {
+                "realm": "Use your developer account, or your SSH key",
+                "headers": "(created)",
+            },
+        ),
+        (
+            "Signature realm=obs, headers=(created)",
+            "signature",
+            {"realm": "obs", "headers": "(created)"},
+        ),
+        ("Negotiate", "negotiate", {}),
+    ],
+)
+def test_parse_auth_challenge(
+    challenge: str, scheme: str, params: dict[str, str]
+) -> None:
+    assert _parse_auth_challenge(challenge) == (scheme, params)
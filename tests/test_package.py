@@ -6,6 +6,9 @@ from py_obs.project import (
     Person,
     branch_package,
     fetch_meta,
+    fetch_meta_many,
+    send_meta,
+    _xpath_literal,
 )
 from py_obs.xml_factory import StrElementField
 from tests.conftest import HOME_PROJ_T, ProjectCleaner
@@ -59,6 +62,33 @@ async def test_fetch_package_meta(home_project: HOME_PROJ_T):
         assert await fetch_meta(osc_, prj=prj, pkg=pkg.name) == pkg
 
 
+@pytest.mark.asyncio
+async def test_fetch_meta_many(home_project: HOME_PROJ_T):
+    osc, _, prj, pkg = home_project
+    await send_meta(
+        osc, prj=prj, pkg=(vim := Package("vim", title=StrElementField("vim editor")))
+    )
+
+    assert await fetch_meta_many(osc, prj=prj, pkgs=["vim", pkg, "not-existing"]) == [
+        vim,
+        pkg,
+    ]
+    assert await fetch_meta_many(osc, prj=prj.name, pkgs=[]) == []
+
+
+@pytest.mark.parametrize(
+    "value,literal",
+    [
+        ("vim", "'vim'"),
+        ("it's", '"it\'s"'),
+        ('say "hi"', "'say \"hi\"'"),
+        ("a'b\"c", "concat('a', \"'\", 'b\"c')"),
+    ],
+)
+def test_xpath_literal(value: str, literal: str) -> None:
+    assert _xpath_literal(value) == literal
+
+
 @pytest.mark.asyncio
 async def test_branch_package(home_project: HOME_PROJ_T):
     osc, admin_osc, prj, pkg = home_project
@@ -0,0 +1,78 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+import py_obs.person as person
+from py_obs.osc import Osc
+from py_obs.xml_factory import StrElementField
+
+
+def _user(login: str) -> person.User:
+    return person.User(
+        login=StrElementField(login), email=None, realname=None, state=None
+    )
+
+
+def _osc(tmp_path: Path, username: str) -> Osc:
+    return Osc(username, password="irrelevant", cookie_jar_path=str(tmp_path / "jar"))
+
+
+def test_user_cache_is_per_instance(tmp_path: Path) -> None:
+    osc, other = _osc(tmp_path, "foo"), _osc(tmp_path, "bar")
+    person._user_cache(osc).put("baz", user := _user("baz"))
+
+    assert person._user_cache(osc).get("baz") == user
+    assert person._user_cache(other).get("baz") is None
+
+    person.clear_cache(osc)
+    assert person._user_cache(osc).get("baz") is None
+
+
+def test_user_cache_is_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(person, "_CACHE_MAXSIZE", 2)
+    cache = person._user_cache(_osc(tmp_path, "foo"))
+    for name in ("a", "b"):
+        cache.put(name, _user(name))
+
+    # "a" is now the most recently used entry => "b" is evicted
+    assert cache.get("a") is not None
+    cache.put("c", _user("c"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_concurrent_fetches_are_joined_per_loop(tmp_path: Path) -> None:
+    cache = person._user_cache(_osc(tmp_path, "foo"))
+    calls = 0
+
+    async def fetch() -> person.User:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return _user("baz")
+
+    async def fetch_concurrently() -> list[person.User]:
+        return await asyncio.gather(*(cache.join("baz", fetch) for _ in range(3)))
+
+    assert asyncio.run(fetch_concurrently()) == [_user("baz")] * 3
+    assert calls == 1
+    assert not cache._in_flight
+
+    # a fetch that is still pending on another loop (e.g. in another thread)
+    # must not be joined, as its task cannot be awaited on this loop
+    async def start_fetch() -> "asyncio.Future[person.User]":
+        return cache.join("baz", fetch)
+
+    loop = asyncio.new_event_loop()
+    pending = loop.run_until_complete(start_fetch())
+
+    async def fetch_once() -> person.User:
+        return await cache.join("baz", fetch)
+
+    assert asyncio.run(fetch_once()) == _user("baz")
+    assert calls == 3
+
+    assert loop.run_until_complete(pending) == _user("baz")
+    loop.close()
+    assert not cache._in_flight
@@ -1,6 +1,6 @@
 import pytest
 from py_obs.osc import Osc
-from py_obs.project import fetch_meta
+from py_obs.project import fetch_meta, fetch_meta_many
 
 from tests.conftest import HOME_PROJ_T, local_obs_apiurl
 
@@ -8,5 +8,6 @@ from tests.conftest import HOME_PROJ_T, local_obs_apiurl
 @pytest.mark.asyncio
 async def test_public_route(home_project: HOME_PROJ_T) -> None:
     _, _, proj, pkg = home_project
-    osc = Osc(public=True, api_url=local_obs_apiurl())
-    assert pkg == await fetch_meta(osc, prj=proj, pkg=pkg)
+    async with Osc(public=True, api_url=local_obs_apiurl()) as osc:
+        assert pkg == await fetch_meta(osc, prj=proj, pkg=pkg)
+        assert await fetch_meta_many(osc, prj=proj, pkgs=[pkg, "not-existing"]) == [pkg]
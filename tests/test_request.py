@@ -5,7 +5,6 @@ from py_obs.history import fetch_package_history
 from py_obs.project import upload_file_contents
 
 from py_obs.request import (
-    _RequestCollection,
     PackageRevision,
     Request,
     RequestAction,
@@ -204,10 +203,10 @@ from tests.conftest import HOME_PROJ_T
     ],
 )
 def test_request_from_obs(api_response: str, expected_list: list[Request]):
-    assert (
-        _RequestCollection.from_xml(ET.fromstring(api_response)).request
-        == expected_list
-    )
+    assert [
+        Request.from_xml(elem)
+        for elem in ET.fromstring(api_response).findall(Request._element_name)
+    ] == expected_list
 
 
 @pytest.mark.asyncio
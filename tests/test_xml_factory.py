@@ -2,7 +2,7 @@ import pytest
 from dataclasses import dataclass, Field
 from typing import ClassVar, Optional, Any
 from xml.etree.ElementTree import fromstring, tostring, canonicalize
-from py_obs.xml_factory import MetaMixin, StrElementField
+from py_obs.xml_factory import MetaMixin, StrElementField, parse_xml, serialize_xml
 
 
 @dataclass(frozen=True)
@@ -64,6 +64,20 @@ class WithTransformer(MetaMixin):
     _element_name: ClassVar[str] = "transformer"
 
 
+@dataclass(frozen=True)
+class WithTransformerTable(MetaMixin):
+    test_element: XmlTestElement
+
+    def _test_element_to_xml(self) -> tuple[Any, str, Any]:
+        return self.test_element.string, "just_a_string", StrElementField
+
+    _field_transformers = {"test_element": _test_element_to_xml}
+
+    _field_converters = WithTransformer._field_converters
+
+    _element_name: ClassVar[str] = "transformer_table"
+
+
 @dataclass(frozen=True)
 class NestedChild(MetaMixin):
     number: int
@@ -112,6 +126,10 @@ class Nested(MetaMixin):
             WithTransformer(test_element=xml_test_element),
             """<transformer><just_a_string>1</just_a_string></transformer>""",
         ),
+        (
+            WithTransformerTable(test_element=xml_test_element),
+            """<transformer_table><just_a_string>1</just_a_string></transformer_table>""",
+        ),
         (
             Nested(
                 "str",
@@ -125,3 +143,31 @@ class Nested(MetaMixin):
 def test_xml_generation(element: MetaMixin, expected_xml: str):
     assert canonicalize(expected_xml) == canonicalize(tostring(element.meta))
     assert element.from_xml(fromstring(expected_xml)) == element
+
+
+def test_from_xml_with_encoding_declaration() -> None:
+    assert (
+        XmlWithBoolean.from_xml(
+            """<?xml version="1.0" encoding="UTF-8"?>
+<with_bool a_bool="false"/>"""
+        )
+        == XmlWithBoolean(False)
+    )
+
+
+@pytest.mark.parametrize("parse", [fromstring, parse_xml])
+def test_serialize_xml(parse) -> None:
+    elem = parse("<entry name='k\u00e4se'>&lt;1&gt;</entry>")
+    assert serialize_xml(elem) == '<entry name="k\u00e4se">&lt;1&gt;</entry>'.encode()
+
+
+def test_slotted_subclasses_have_no_dict() -> None:
+    @dataclass(frozen=True, slots=True)
+    class Slotted(MetaMixin):
+        value: str
+
+        _element_name: ClassVar[str] = "slotted"
+
+    slotted = Slotted.from_xml('<slotted value="foo"/>')
+    assert slotted == Slotted("foo")
+    assert not hasattr(slotted, "__dict__")